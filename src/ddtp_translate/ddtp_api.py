@@ -1,18 +1,56 @@
 """DDTP HTTP API client — fetch untranslated Debian package descriptions."""
 
+import bz2
+import contextlib
+import functools
+import gzip
 import hashlib
 import json
+import lzma
 import os
+import pickle
 import re
+import tempfile
+import threading
 import time
-import urllib.request
+import types
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
+from .http_session import HTTPSession, HTTPStatusError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DDTP_BASE = "https://ddtp.debian.org/ddt.cgi"
+# ddt.cgi endpoints tried in order before falling back to the mirror
+DDTP_BASES = (DDTP_BASE,)
 # Fallback: fetch from Debian mirror i18n Translation files
 MIRROR_BASE = "https://deb.debian.org/debian"
 DISTS = ["sid", "trixie", "bookworm"]
+# Translation file compressions, in order of preference: xz is the
+# smallest download, gzip the cheapest to decompress, bz2 the fallback
+# that every mirror carries.
+_TRANSLATION_CODECS = ((".xz", lzma.open), (".gz", gzip.open), (".bz2", bz2.open))
 CACHE_TTL = 86400  # 24 hours
+# The statistics page changes through the day; it is small and revalidated
+STATS_CACHE_TTL = 15 * 60
+FETCH_WORKERS = 8  # parallel language downloads in fetch_all_untranslated
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 60
+
+# Shared keep-alive session: the mirror, ddt.cgi and popcon fetches reuse
+# one TLS connection per host and thread instead of reconnecting each time.
+_SESSION = HTTPSession(
+    user_agent="ddtp-translate/0.1",
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=READ_TIMEOUT,
+    retries=3,
+    backoff_factor=0.5,
+)
 
 # All DDTP-supported language codes
 DDTP_LANGUAGES = [
@@ -55,32 +93,139 @@ DDTP_LANGUAGES = [
     ("zh_CN", "Chinese (Simplified)"),
     ("zh_TW", "Chinese (Traditional)"),
 ]
+# Read-only lang_code -> name lookup and the set of valid codes
+DDTP_LANGUAGE_NAMES = types.MappingProxyType(dict(DDTP_LANGUAGES))
+DDTP_LANG_SET = frozenset(DDTP_LANGUAGE_NAMES)
 
 
+@functools.cache
 def _cache_dir():
+    # Resolved and created once per process; every cache path goes through here
     xdg = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
     d = Path(xdg) / "ddtp-translate"
     d.mkdir(parents=True, exist_ok=True)
     return d
 
 
+@contextlib.contextmanager
+def _atomic_open(path):
+    """Open a temporary file next to path for binary writing.
+
+    It replaces path only once the block completes, so an interrupted
+    write never leaves a truncated cache behind.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
 def _cache_path(lang):
-    return _cache_dir() / f"untranslated_{lang}.json"
+    return _cache_dir() / f"untranslated_{lang}.pkl"
+
+
+# First byte of a pickled package cache; bump it when the entry layout
+# changes so old caches are refetched instead of misread.
+_PICKLE_CACHE_VERSION = b"\x01"
+
+
+def _pickle_load(path):
+    """Read a pickled package cache, or None if it is unreadable or outdated."""
+    try:
+        with open(path, "rb") as f:
+            if f.read(1) != _PICKLE_CACHE_VERSION:
+                return None
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _pickle_dump(path, obj):
+    with _atomic_open(path) as f:
+        f.write(_PICKLE_CACHE_VERSION)
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _json_load(path):
+    """Read a JSON cache file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _json_dump(path, obj):
+    """Write a JSON cache file, using orjson when it is installed.
+
+    Caches are written compact; indentation only made them bigger and
+    slower to load.
+    """
+    with _atomic_open(path) as f:
+        if orjson is not None:
+            f.write(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            f.write(json.dumps(obj, ensure_ascii=False).encode("utf-8"))
+
+
+_cache_locks = {}
+_cache_locks_guard = threading.Lock()
 
 
-def _is_cache_valid(path):
-    if not path.exists():
+def _cache_lock(lang):
+    """Return the lock serialising cache access for one language."""
+    with _cache_locks_guard:
+        return _cache_locks.setdefault(lang, threading.Lock())
+
+
+def _is_cache_valid(path, ttl=CACHE_TTL):
+    try:
+        return (time.time() - os.stat(path).st_mtime) < ttl
+    except OSError:
         return False
-    return (time.time() - path.stat().st_mtime) < CACHE_TTL
 
 
-def compute_description_hash(description):
+def compute_description_hash(description, _md5=hashlib.md5):
     """Compute MD5 hash of the description (used in DDTP email subject)."""
-    return hashlib.md5(description.encode("utf-8")).hexdigest()
+    # Not a security use; this also keeps MD5 available on FIPS systems
+    return _md5(description.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
-def parse_ddtp_response(text):
-    """Parse DDTP ddt.cgi response into list of package dicts.
+def compute_description_hashes(descriptions, _md5=hashlib.md5):
+    """Yield the MD5 hash of each description in an iterable."""
+    for description in descriptions:
+        yield _md5(description.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+# Both parsers classify a line by its first character (continuation) or by
+# the field name before ": " with one dict lookup, instead of trying each
+# prefix with startswith() in turn.
+_CONTINUATION = (" ", "\t")
+_DDTP_FIELDS = {"Description-md5": "md5", "Description-en": "short"}
+# Translation files are scanned as bytes; only extracted values are decoded
+_CONTINUATION_BYTES = (b" ", b"\t")
+_TRANSLATION_FIELDS = {b"Package": "package", b"Description-md5": "md5"}
+
+
+def _add_long_line(parts, stripped):
+    """Append one long-description line; parts is joined with newlines later.
+
+    A lone "." marks an empty paragraph line.
+    """
+    if stripped == ".":
+        if not parts:
+            parts.append("")
+        parts.append("")
+    else:
+        parts.append(stripped)
+
+
+def iter_parse_ddtp(text):
+    """Parse a DDTP ddt.cgi response, yielding one package dict at a time.
 
     Response format (one per package, separated by blank lines):
         Package: <name>
@@ -90,112 +235,257 @@ def parse_ddtp_response(text):
          <long description line 2>
          .
     """
-    packages = []
     current = None
 
     for line in text.splitlines():
-        if line.startswith("Package: "):
+        if line[:1] in _CONTINUATION:
             if current:
-                packages.append(current)
+                _add_long_line(current["long"], line.strip())
+            continue
+        key, sep, value = line.partition(": ")
+        if not sep:
+            continue
+        if key == "Package":
+            if current:
+                current["long"] = "\n".join(current["long"])
+                yield current
             current = {
-                "package": line[9:].strip(),
+                "package": value.strip(),
                 "md5": "",
                 "short": "",
-                "long": "",
+                "long": [],
             }
-        elif line.startswith("Description-md5: ") and current:
-            current["md5"] = line[17:].strip()
-        elif line.startswith("Description-en: ") and current:
-            current["short"] = line[16:].strip()
-        elif current and (line.startswith(" ") or line.startswith("\t")):
-            stripped = line.strip()
-            if stripped == ".":
-                current["long"] += "\n"
-            else:
-                if current["long"]:
-                    current["long"] += "\n"
-                current["long"] += stripped
+        elif current:
+            field = _DDTP_FIELDS.get(key)
+            if field:
+                current[field] = value.strip()
 
     if current:
-        packages.append(current)
+        current["long"] = "\n".join(current["long"])
+        yield current
 
-    return packages
 
+def parse_ddtp_response(text):
+    """Parse DDTP ddt.cgi response into list of package dicts."""
+    return list(iter_parse_ddtp(text))
+
+
+# Returned by _fetch_translation_file when a conditional request gets a 304
+_NOT_MODIFIED = object()
+
+
+def _fetch_translation_file(dist, lang, meta=None):
+    """Open Translation-XX on the Debian mirror as a stream of lines.
+
+    The mirror publishes the files with several compressions; they are
+    tried in _TRANSLATION_CODECS order. Returns None if none of them can
+    be fetched. Otherwise the returned iterator yields undecoded bytes
+    lines, decompressing the body while it is being downloaded, so
+    neither the compressed nor the decompressed file is held in memory. It must be consumed (or
+    closed) before the next request to the mirror.
+
+    meta, if given, is a dict of validators from an earlier download
+    (ext, etag, last_modified, max_age). They are sent as a conditional
+    request and _NOT_MODIFIED is returned on 304. The dict is updated in
+    place with the validators of the new response, or emptied on failure.
+    """
+    base = f"{MIRROR_BASE}/dists/{dist}/main/i18n/Translation-{lang}"
+    previous = dict(meta or {})
+    if meta is not None:
+        meta.clear()
+    codecs = sorted(_TRANSLATION_CODECS, key=lambda c: c[0] != previous.get("ext"))
+    for ext, opener in codecs:
+        headers = {}
+        if ext == previous.get("ext"):
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+        stack = contextlib.ExitStack()
+        try:
+            resp = stack.enter_context(_SESSION.open(base + ext, headers=headers))
+        except HTTPStatusError:
+            continue
+        except Exception:
+            return None
+        if resp.status == 304:
+            stack.close()
+            if meta is not None:
+                meta.update(previous)
+            return _NOT_MODIFIED
+        if meta is not None:
+            meta.update(
+                ext=ext,
+                etag=resp.getheader("ETag"),
+                last_modified=resp.getheader("Last-Modified"),
+                max_age=_max_age(resp),
+            )
+        return _iter_translation_lines(stack, opener(resp, "rb"))
+    return None
+
+
+def _max_age(resp):
+    """Return the Cache-Control max-age of a response in seconds, or 0."""
+    m = re.search(r"max-age=(\d+)", resp.getheader("Cache-Control") or "")
+    return int(m.group(1)) if m else 0
+
+
+def _iter_translation_lines(stack, f):
+    with stack, f:
+        yield from f
+
+
+def _fetch_revalidated(url, cache, read_timeout):
+    """GET url as a conditional request against the copy saved at cache.
+
+    The ETag and Last-Modified of the last download are kept next to
+    cache in a .meta.json file. Returns _NOT_MODIFIED if the server
+    answers 304, otherwise (body, validators); the caller writes the
+    validators with _save_validators once cache has been rewritten.
+    """
+    headers = {}
+    if cache.exists():
+        try:
+            meta = _json_load(cache.with_suffix(".meta.json"))
+        except Exception:
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    with _SESSION.open(url, headers=headers, read_timeout=read_timeout) as resp:
+        if resp.status == 304:
+            return _NOT_MODIFIED
+        validators = {"etag": resp.getheader("ETag"), "last_modified": resp.getheader("Last-Modified")}
+        return resp.read(), validators
+
+
+def _save_validators(cache, validators):
+    _json_dump(cache.with_suffix(".meta.json"), validators)
+
+
+def _translation_entry(package, md5, short, long_parts):
+    return {
+        "package": package.decode("utf-8", "replace"),
+        "md5": md5,
+        "short": short.decode("utf-8", "replace"),
+        "long": b"\n".join(long_parts).decode("utf-8", "replace"),
+    }
 
-def _fetch_translation_file(dist, lang):
-    """Download and decompress Translation-XX.bz2 from Debian mirror."""
-    import bz2
-    url = f"{MIRROR_BASE}/dists/{dist}/main/i18n/Translation-{lang}.bz2"
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "ddtp-translate/0.1"})
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            compressed = resp.read()
-        return bz2.decompress(compressed).decode("utf-8", errors="replace")
-    except Exception:
-        return None
 
+def iter_parse_translation(lines, exclude_md5s=frozenset()):
+    """Parse Debian Translation lines, yielding {package, md5, short, long} dicts.
 
-def _parse_translation_file(text):
-    """Parse Debian Translation file into dict of md5 -> {package, short, long}."""
-    entries = {}
-    current = {}
+    lines may be any iterable of bytes lines, with or without line
+    endings. Entries without a Description-md5 are skipped, and so are
+    entries whose md5 is in exclude_md5s; their long descriptions are
+    not even collected.
+    """
+    package = short = b""
+    md5 = ""
+    long_parts = []
     in_desc = False
 
-    for line in text.splitlines():
-        if line.startswith("Package: "):
-            if current.get("md5"):
-                entries[current["md5"]] = current
-            current = {"package": line[9:].strip(), "md5": "", "short": "", "long": ""}
+    for line in lines:
+        if line[:1] in _CONTINUATION_BYTES:
+            if in_desc:
+                stripped = line.strip()
+                if stripped == b".":
+                    if not long_parts:
+                        long_parts.append(b"")
+                    long_parts.append(b"")
+                else:
+                    long_parts.append(stripped)
+            continue
+        key, sep, value = line.partition(b": ")
+        field = _TRANSLATION_FIELDS.get(key) if sep else None
+        if field == "package":
+            if md5 and md5 not in exclude_md5s:
+                yield _translation_entry(package, md5, short, long_parts)
+            package, md5, short, long_parts = value.strip(), "", b"", []
             in_desc = False
-        elif line.startswith("Description-md5: "):
-            current["md5"] = line[17:].strip()
-        elif line.startswith("Description-"):
-            current["short"] = line.split(": ", 1)[1] if ": " in line else ""
-            in_desc = True
-        elif in_desc and (line.startswith(" ") or line.startswith("\t")):
-            stripped = line.strip()
-            if stripped == ".":
-                current["long"] += "\n"
-            else:
-                if current["long"]:
-                    current["long"] += "\n"
-                current["long"] += stripped
+        elif field == "md5":
+            md5 = value.strip().decode("ascii", "replace")
+        elif key.startswith(b"Description-"):
+            short = value.rstrip(b"\r\n")
+            in_desc = md5 not in exclude_md5s
         else:
             in_desc = False
 
-    if current.get("md5"):
-        entries[current["md5"]] = current
-    return entries
+    if md5 and md5 not in exclude_md5s:
+        yield _translation_entry(package, md5, short, long_parts)
 
 
-def fetch_untranslated_from_mirror(lang, dist="sid"):
-    """Fetch untranslated descriptions by comparing en vs lang Translation files."""
-    cache = _cache_dir() / f"mirror_untranslated_{lang}_{dist}.json"
+def _iter_translation_md5s(lines):
+    """Yield only the Description-md5 values from Translation bytes lines."""
+    for line in lines:
+        if line.startswith(b"Description-md5: "):
+            yield line[17:].strip().decode("ascii", "replace")
 
-    if _is_cache_valid(cache):
-        with open(cache, "r", encoding="utf-8") as f:
-            return json.load(f)
 
-    en_text = _fetch_translation_file(dist, "en")
-    if not en_text:
-        raise RuntimeError(f"Failed to download Translation-en for {dist}")
+def _translated_md5s(lines):
+    """Only the md5s of the translated file matter for the diff."""
+    return frozenset(_iter_translation_md5s(lines)) if lines is not None else frozenset()
 
-    lang_text = _fetch_translation_file(dist, lang)
 
-    en_entries = _parse_translation_file(en_text)
-    lang_entries = _parse_translation_file(lang_text) if lang_text else {}
+def fetch_untranslated_from_mirror(lang, dist="sid"):
+    """Fetch untranslated descriptions by comparing en vs lang Translation files.
 
-    # Untranslated = in en but not in lang
-    untranslated = []
-    for md5, entry in en_entries.items():
-        if md5 not in lang_entries:
-            untranslated.append(entry)
+    Once the cache has expired, the validators saved next to it are used
+    for conditional requests; if neither Translation file has changed the
+    cache is kept and only its timestamp is refreshed.
+    """
+    cache = _cache_dir() / f"mirror_untranslated_{lang}_{dist}.json"
+    meta_path = cache.with_name(f"mirror_untranslated_{lang}_{dist}.meta.json")
+
+    meta = {}
+    if cache.exists() and meta_path.exists():
+        try:
+            meta = _json_load(meta_path)
+        except Exception:
+            meta = {}
+    en_meta = meta.get("en", {})
+    lang_meta = meta.get(lang, {})
+
+    # A longer max-age from the mirror extends the local TTL
+    ttl = max(CACHE_TTL, min(en_meta.get("max_age") or 0, lang_meta.get("max_age") or 0))
+    if _is_cache_valid(cache, ttl):
+        return _json_load(cache)
+
+    # The translated file is reduced to its md5s first, so that en can be
+    # filtered while it streams and translated entries are never built.
+    lang_lines = _fetch_translation_file(dist, lang, lang_meta)
+    en_lines = None
+    if lang_lines is _NOT_MODIFIED:
+        en_lines = _fetch_translation_file(dist, "en", en_meta)
+        if en_lines is _NOT_MODIFIED:
+            os.utime(cache)
+            return _json_load(cache)
+        if en_lines is None:
+            raise RuntimeError(f"Failed to download Translation-en for {dist}")
+        # en changed, so the lang md5s are needed after all; the pool
+        # serves this on a second connection while en is still open.
+        lang_meta = {}
+        lang_lines = _fetch_translation_file(dist, lang, lang_meta)
+    lang_md5s = _translated_md5s(lang_lines)
+
+    if en_lines is None:
+        en_meta = {}
+        en_lines = _fetch_translation_file(dist, "en", en_meta)
+        if en_lines is None:
+            raise RuntimeError(f"Failed to download Translation-en for {dist}")
+
+    # Untranslated = in en but not in lang; a repeated md5 keeps its last entry
+    untranslated = {}
+    for entry in iter_parse_translation(en_lines, lang_md5s):
+        untranslated[entry["md5"]] = entry
+    untranslated = list(untranslated.values())
 
     # Sort by package name
-    untranslated.sort(key=lambda x: x.get("package", ""))
+    untranslated.sort(key=itemgetter("package"))
 
-    with open(cache, "w", encoding="utf-8") as f:
-        json.dump(untranslated, f, ensure_ascii=False, indent=2)
+    _json_dump(cache, untranslated)
+    _json_dump(meta_path, {"en": en_meta, lang: lang_meta})
 
     return untranslated
 
@@ -205,40 +495,104 @@ def fetch_untranslated(lang, force_refresh=False):
     
     Tries ddtp.debian.org first, falls back to Debian mirror comparison.
     """
+    with _cache_lock(lang):
+        return _fetch_untranslated(lang, force_refresh)
+
+
+def load_cached_untranslated(lang):
+    """Return the cached untranslated descriptions for lang, however old.
+
+    Returns None if there is no cache yet. Never touches the network, so
+    a UI can show the last list while fetch_untranslated() updates it.
+    """
     cache = _cache_path(lang)
+    try:
+        st = os.stat(cache)
+    except OSError:
+        return None
+    packages = _load_package_cache(str(cache), st.st_mtime_ns)
+    return list(packages) if packages is not None else None
 
-    if not force_refresh and _is_cache_valid(cache):
-        with open(cache, "r", encoding="utf-8") as f:
-            return json.load(f)
+
+def fetch_all_untranslated(langs, force_refresh=False):
+    """Fetch untranslated descriptions for several languages in parallel.
+
+    The downloads are network-bound, so they are overlapped on a thread
+    pool. Returns dict mapping lang_code -> list of package dicts;
+    languages that could not be fetched are left out.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        futures = {
+            lang: pool.submit(fetch_untranslated, lang, force_refresh)
+            for lang in langs
+        }
+        for lang, future in futures.items():
+            try:
+                results[lang] = future.result()
+            except Exception:
+                continue
+    return results
+
+
+@functools.lru_cache(maxsize=64)
+def _load_package_cache(path, mtime_ns):
+    """Load a package cache once per file version.
+
+    Keyed on the file's mtime, so a warm call skips the disk and a
+    rewritten cache is read again. The cached list is shared, so the
+    public functions hand out copies of it.
+    """
+    return _pickle_load(Path(path))
+
+
+def _store_package_cache(cache, packages):
+    """Write a package cache and drop the loaded versions of old ones."""
+    _pickle_dump(cache, packages)
+    _load_package_cache.cache_clear()
+
+
+def _fetch_untranslated(lang, force_refresh):
+    cache = _cache_path(lang)
+
+    if force_refresh:
+        _load_package_cache.cache_clear()
+    else:
+        try:
+            st = os.stat(cache)
+        except OSError:
+            st = None
+        if st is not None and time.time() - st.st_mtime < CACHE_TTL:
+            packages = _load_package_cache(str(cache), st.st_mtime_ns)
+            if packages is not None:
+                return list(packages)
 
     # Try ddtp.debian.org first
-    url = f"{DDTP_BASE}?lcode={lang}&getuntranslated=1"
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "ddtp-translate/0.1"})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            text = resp.read().decode("utf-8", errors="replace")
-        packages = parse_ddtp_response(text)
-        if packages:
-            with open(cache, "w", encoding="utf-8") as f:
-                json.dump(packages, f, ensure_ascii=False, indent=2)
-            return packages
-    except Exception:
-        pass
+    for base in DDTP_BASES:
+        url = f"{base}?lcode={lang}&getuntranslated=1"
+        try:
+            with _SESSION.open(url, read_timeout=15) as resp:
+                text = resp.read().decode("utf-8", errors="replace")
+            packages = parse_ddtp_response(text)
+            if packages:
+                _store_package_cache(cache, packages)
+                return packages
+        except Exception:
+            continue
 
     # Fallback: Debian mirror comparison
     try:
         packages = fetch_untranslated_from_mirror(lang, "sid")
         if packages:
-            with open(cache, "w", encoding="utf-8") as f:
-                json.dump(packages, f, ensure_ascii=False, indent=2)
+            _store_package_cache(cache, packages)
             return packages
     except Exception:
         pass
 
     # Last resort: stale cache
-    if cache.exists():
-        with open(cache, "r", encoding="utf-8") as f:
-            return json.load(f)
+    packages = _pickle_load(cache) if cache.exists() else None
+    if packages is not None:
+        return packages
 
     raise RuntimeError(
         "Could not fetch DDTP data. Both ddtp.debian.org and "
@@ -247,30 +601,41 @@ def fetch_untranslated(lang, force_refresh=False):
     )
 
 
+def export_json(lang, path):
+    """Write the untranslated descriptions for a language to path as JSON.
+
+    The package cache itself is pickled; this keeps a readable export
+    for scripts and older tools. Returns the number of packages written.
+    """
+    packages = fetch_untranslated(lang)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(packages, f, ensure_ascii=False, indent=2)
+    return len(packages)
+
+
 def fetch_popcon_data(force_refresh=False):
     """Fetch Debian popcon (popularity contest) install counts.
 
     Returns dict mapping package_name -> install_count.
     Data from https://popcon.debian.org/by_inst.gz
     """
-    import gzip
     cache = _cache_dir() / "popcon_by_inst.json"
 
     if not force_refresh and _is_cache_valid(cache):
-        with open(cache, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _json_load(cache)
 
     url = "https://popcon.debian.org/by_inst.gz"
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "ddtp-translate/0.8"})
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            compressed = resp.read()
+        result = _fetch_revalidated(url, cache, read_timeout=30)
+        if result is _NOT_MODIFIED:
+            os.utime(cache)
+            return _json_load(cache)
+        compressed, validators = result
         text = gzip.decompress(compressed).decode("utf-8", errors="replace")
     except Exception as exc:
         # Try stale cache
         if cache.exists():
-            with open(cache, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _json_load(cache)
         return {}
 
     popcon = {}
@@ -294,8 +659,8 @@ def fetch_popcon_data(force_refresh=False):
             except (ValueError, IndexError):
                 continue
 
-    with open(cache, "w", encoding="utf-8") as f:
-        json.dump(popcon, f, ensure_ascii=False)
+    _json_dump(cache, popcon)
+    _save_validators(cache, validators)
 
     return popcon
 
@@ -311,20 +676,21 @@ def fetch_ddtp_stats():
     Also returns total_packages and active_packages as top-level keys.
     """
     cache = _cache_dir() / "ddtp_stats.json"
-    if _is_cache_valid(cache):
-        with open(cache, "r", encoding="utf-8") as f:
-            return json.load(f)
+    if _is_cache_valid(cache, STATS_CACHE_TTL):
+        return _json_load(cache)
 
     url = "https://ddtp.debian.org/"
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "ddtp-translate/0.1"})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            text = resp.read().decode("utf-8", errors="replace")
+        result = _fetch_revalidated(url, cache, read_timeout=15)
+        if result is _NOT_MODIFIED:
+            os.utime(cache)
+            return _json_load(cache)
+        body, validators = result
+        text = body.decode("utf-8", errors="replace")
     except Exception as exc:
         # Try stale cache
         if cache.exists():
-            with open(cache, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _json_load(cache)
         raise RuntimeError(f"Could not fetch DDTP statistics: {exc}")
 
     stats = {"languages": {}, "total_packages": 0, "active_packages": 0}
@@ -350,7 +716,7 @@ def fetch_ddtp_stats():
             "total_translations": int(m.group(4)),
         }
 
-    with open(cache, "w", encoding="utf-8") as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
+    _json_dump(cache, stats)
+    _save_validators(cache, validators)
 
     return stats
@@ -52,20 +52,60 @@ Flow:
     6. After sufficient reviews, DDTSS sends it to DDTP automatically
 """
 
+import http.client
 import http.cookiejar
+import json
 import re
-import urllib.error
+import threading
+import time
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
 from pathlib import Path
 
+from .http_session import HTTPSession
+
 DDTSS_BASE = "https://ddtp.debian.org/ddtss/index.cgi"
 USER_AGENT = "ddtp-translate/0.7.0 (GTK4; +https://github.com/yeager/ddtp-translate)"
 
+# Seconds a read-only page (main page, review pages) is served from memory
+GET_CACHE_TTL = 30
+
+# Multipart framing, encoded once
+_BOUNDARY = b"----DDTPTranslateBoundary"
+_MULTIPART_CONTENT_TYPE = "multipart/form-data; boundary=" + _BOUNDARY.decode()
+
+# Parallel page loads in get_review_pages/prefetch_next
+BATCH_WORKERS = 4
+
 # XDG config for cookie persistence
 _XDG = Path.home() / ".config" / "ddtp-translate"
 
+# Keep-alive connections to ddtp.debian.org, shared by all clients. A
+# submission (fetch, GET translate, POST) then costs one TLS handshake.
+_SESSION = HTTPSession(user_agent=USER_AGENT, read_timeout=30)
+
+# Page scraping patterns, compiled once
+_RE_H1 = re.compile(rb"<h1>(.*?)</h1>", re.DOTALL)
+_RE_TAGS = re.compile(r"<[^>]+>")
+_RE_FETCH_REDIRECT = re.compile(r"/(?:translate|forreview)/([\w.+-]+)")
+_RE_TRANSLATE_LINK = re.compile(r"translate/([\w.+-]+)")
+_RE_PENDING_TRANSLATION = re.compile(r"Pending translation.*?<ol>(.*?)</ol>", re.DOTALL)
+_RE_PENDING_REVIEW = re.compile(r"Pending review.*?<ol>(.*?)</ol>", re.DOTALL)
+_RE_REVIEWED_BY_YOU = re.compile(r"Reviewed by you.*?<ol>(.*?)</ol>", re.DOTALL)
+_RE_RECENTLY_DDTPD = re.compile(r"Recently DDTP.*?<ol>(.*?)</ol>", re.DOTALL)
+_RE_REVIEW_ITEM = re.compile(r'forreview/([\w.+-]+)\?(\d+)">([\w.+-]+)</a>\s*\(([^)]*)\)')
+_RE_RECENT_ITEM = re.compile(r">([\w.+-]+)</(?:a|li)")
+_RE_OWNER = re.compile(r"the owner is:\s*<b>(.*?)</b>")
+_RE_LOG = re.compile(r"Log:\s*<pre>(.*?)</pre>", re.DOTALL)
+# Success markers, matched against the raw response bytes
+_LOGIN_OK = (b"Logged in as", b"logged in", b"Pending translation", b"Pending review")
+_RE_SUBMITTED = re.compile(rb"submitted", re.IGNORECASE)
+# Only digits are extracted, so the stats are read from the raw bytes
+_RE_STATS = re.compile(
+    rb"Pending translation.*?(\d+).*?Pending review.*?(\d+).*?Sent.*?(\d+)", re.DOTALL
+)
+
 
 class DDTSSError(Exception):
     """Base error for DDTSS operations."""
@@ -92,6 +132,48 @@ class DDTSSValidationError(DDTSSError):
     pass
 
 
+# Known DDTSS error messages, in order of precedence
+_ERROR_PATTERNS = {
+    "You must be logged in": DDTSSAuthError,
+    "Invalid username/password": DDTSSAuthError,
+    "Account not active yet": DDTSSAuthError,
+    "locked, sorry": DDTSSLockedError,
+    "gone, sorry": DDTSSNotFoundError,
+    "Couldn't fetch": DDTSSNotFoundError,
+    "didn't contain package name": DDTSSNotFoundError,
+    "Encoding error": DDTSSError,
+    "not complete, still <trans>": DDTSSValidationError,
+    "line longer than 80 characters": DDTSSValidationError,
+}
+# Error detection runs on the undecoded body
+_RE_ERRORS = re.compile(b"|".join(re.escape(p.encode()) for p in _ERROR_PATTERNS))
+# At least one of these occurs in every _ERROR_PATTERNS message; pages
+# without any of them skip the regex scan
+_ERROR_CANARIES = (
+    b"logged", b"password", b"active", b"sorry", b"Couldn't",
+    b"contain", b"Encoding", b"<trans>", b"longer",
+)
+# (matched bytes, message, exception class), in _ERROR_PATTERNS order
+_ERROR_TABLE = tuple((p.encode(), p, cls) for p, cls in _ERROR_PATTERNS.items())
+
+
+def _decode(body):
+    return body.decode("utf-8", errors="replace")
+
+
+def _make_cookie(name, value, domain, path="/", secure=False, expires=None):
+    """Rebuild a cookie saved by DDTSSClient._save_cookies."""
+    return http.cookiejar.Cookie(
+        version=0, name=name, value=value,
+        port=None, port_specified=False,
+        domain=domain, domain_specified=domain.startswith("."),
+        domain_initial_dot=domain.startswith("."),
+        path=path, path_specified=True,
+        secure=secure, expires=expires, discard=expires is None,
+        comment=None, comment_url=None, rest={},
+    )
+
+
 class _FormParser(HTMLParser):
     """Extract form fields and error messages from DDTSS HTML."""
 
@@ -105,9 +187,30 @@ class _FormParser(HTMLParser):
         self.title = ""
         self.error_message = ""
         self._in_body = False
+        # Text of the first class="untranslated" block (original description)
+        self.untranslated = None
+        self._in_untranslated = False
+        self._untranslated_buf = []
+        # Text after the first "Description:", up to a line break
+        self.description = None
+        self._in_description = False
+        self._description_buf = []
+        # Target of a <meta http-equiv="refresh">, if any
+        self.refresh_url = None
+        # Text of the first <tt> and <pre> after "Untranslated:" (review page)
+        self.untranslated_short = None
+        self.untranslated_long = None
+        self._after_untranslated = False
+        self._capture = None  # (tag, buffer) while inside one of those
 
     def handle_starttag(self, tag, attrs):
         attrs_d = dict(attrs)
+        if tag == "meta" and (attrs_d.get("http-equiv") or "").lower() == "refresh":
+            content = attrs_d.get("content") or ""
+            _delay, found, url = content.lower().partition("url=")
+            if found:
+                start = len(content) - len(url)
+                self.refresh_url = content[start:].strip().strip("'\"")
         if tag == "input" and "name" in attrs_d:
             self.fields[attrs_d["name"]] = attrs_d.get("value", "")
         if tag == "textarea" and "name" in attrs_d:
@@ -115,6 +218,15 @@ class _FormParser(HTMLParser):
             self._textarea_buf = []
         if tag == "h1":
             self._in_h1 = True
+        if tag == "br" and self._in_description:
+            self._end_description()
+        if self._after_untranslated and self._capture is None and (
+                (tag == "tt" and self.untranslated_short is None)
+                or (tag == "pre" and self.untranslated_long is None)):
+            self._capture = (tag, [])
+        if (self.untranslated is None and not self._in_untranslated
+                and "untranslated" in (attrs_d.get("class") or "").split()):
+            self._in_untranslated = True
 
     def handle_endtag(self, tag):
         if tag == "textarea" and self._in_textarea:
@@ -122,99 +234,248 @@ class _FormParser(HTMLParser):
             self._in_textarea = None
         if tag == "h1":
             self._in_h1 = False
+        if self._in_untranslated and tag in ("pre", "div", "td"):
+            self.untranslated = "".join(self._untranslated_buf)
+            self._in_untranslated = False
+        if self._capture is not None and tag == self._capture[0]:
+            text = "".join(self._capture[1])
+            if tag == "tt":
+                self.untranslated_short = text
+            else:
+                self.untranslated_long = text
+            self._capture = None
 
     def handle_data(self, data):
         if self._in_textarea:
             self._textarea_buf.append(data)
         if self._in_h1:
             self.title += data
+        if self._in_untranslated:
+            self._untranslated_buf.append(data)
+        if self._capture is not None:
+            self._capture[1].append(data)
+        elif not self._after_untranslated and "Untranslated:" in data:
+            self._after_untranslated = True
+        if self.description is None and not self._in_description:
+            before, found, data = data.partition("Description:")
+            if not found:
+                return
+            self._in_description = True
+            data = data.lstrip()
+        if self._in_description:
+            text, newline, _rest = data.partition("\n")
+            self._description_buf.append(text)
+            if newline:
+                self._end_description()
+
+    def close(self):
+        super().close()
+        if self._in_description:
+            self._end_description()
+
+    def _end_description(self):
+        self.description = "".join(self._description_buf).strip()
+        self._in_description = False
+
+
+def _parse_form(body):
+    """Run _FormParser over a page once and return it."""
+    parser = _FormParser()
+    parser.feed(body)
+    parser.close()
+    return parser
 
 
 class DDTSSClient:
-    """HTTP client for the DDTSS web interface."""
+    """HTTP client for the DDTSS web interface.
+
+    One client may be shared by several threads. _lock guards the
+    session cookie, the GET cache, the parse memo and _ready_translate;
+    the cookie jar has a lock of its own.
+    """
 
     def __init__(self, lang="sv"):
         self.lang = lang
-        self._cookie_jar = http.cookiejar.MozillaCookieJar()
-        self._cookie_file = _XDG / "ddtss_cookies.txt"
-        self._opener = urllib.request.build_opener(
-            urllib.request.HTTPCookieProcessor(self._cookie_jar)
-        )
+        self._cookie_jar = http.cookiejar.CookieJar()
+        self._cookie_file = _XDG / "ddtss_cookie.json"
+        self._id_cookie = None
+        self._id_cookie_expires = 0.0  # epoch seconds; inf for a session cookie
+        self.cache_ttl = GET_CACHE_TTL
+        self._get_cache = {}  # url → (monotonic time, status, body bytes)
+        self._parse_memo = {}  # key → (body, parsed result)
+        # Bumped by invalidate_cache(); a GET that started before the
+        # bump must not store its now outdated response
+        self._cache_generation = 0
+        # Packages whose translate form was loaded this session
+        self._ready_translate = set()
+        self._lock = threading.Lock()
         self._load_cookies()
 
     def _load_cookies(self):
         """Load saved cookies if available."""
         try:
-            if self._cookie_file.exists():
-                self._cookie_jar.load(str(self._cookie_file), ignore_discard=True)
+            with open(self._cookie_file, "rb") as f:
+                for entry in json.loads(f.read()):
+                    self._cookie_jar.set_cookie(_make_cookie(**entry))
+        except FileNotFoundError:
+            self._migrate_cookies()
+        except Exception:
+            pass
+        self._refresh_id_cookie()
+
+    def _migrate_cookies(self):
+        """Import cookies saved in Mozilla format by older versions."""
+        legacy = _XDG / "ddtss_cookies.txt"
+        if not legacy.exists():
+            return
+        try:
+            jar = http.cookiejar.MozillaCookieJar()
+            jar.load(str(legacy), ignore_discard=True)
         except Exception:
+            return
+        for cookie in jar:
+            self._cookie_jar.set_cookie(cookie)
+        try:
+            self._save_cookies()
+            legacy.unlink()
+        except OSError:
             pass
 
     def _save_cookies(self):
         """Persist cookies to disk."""
         self._cookie_file.parent.mkdir(parents=True, exist_ok=True)
-        self._cookie_jar.save(str(self._cookie_file), ignore_discard=True)
+        data = [
+            {"name": c.name, "value": c.value, "domain": c.domain,
+             "path": c.path, "secure": c.secure, "expires": c.expires}
+            for c in self._jar_cookies()
+        ]
+        with open(self._cookie_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        self._refresh_id_cookie()
+
+    def _jar_cookies(self):
+        """Return a snapshot of the cookie jar.
+
+        Responses on other threads add cookies while it is read, so the
+        jar is copied under its own lock.
+        """
+        with self._cookie_jar._cookies_lock:
+            return list(self._cookie_jar)
+
+    def _refresh_id_cookie(self):
+        """Remember the DDTSS session cookie, preferring an unexpired one."""
+        id_cookie = None
+        for cookie in self._jar_cookies():
+            if cookie.name == "id" and "ddtp.debian.org" in (cookie.domain or ""):
+                id_cookie = cookie
+                if not cookie.is_expired():
+                    break
+        if id_cookie is None:
+            expires = 0.0
+        elif id_cookie.expires is None:
+            expires = float("inf")
+        else:
+            expires = float(id_cookie.expires)
+        with self._lock:
+            self._id_cookie = id_cookie
+            self._id_cookie_expires = expires
+
+    def _request(self, url, data=None, method="GET", multipart=False, cache=False):
+        """Make an HTTP request and return (status_code, body_bytes).
+
+        The body is left undecoded; callers that parse it use _decode().
 
-    def _request(self, url, data=None, method="GET", multipart=False):
-        """Make an HTTP request and return (status_code, body_text).
+        With cache=True, a GET is answered from memory if the same URL was
+        fetched successfully less than cache_ttl seconds ago. Any other
+        request may change server state and drops the cache.
 
         Raises DDTSSError on connection failures.
         """
-        headers = {"User-Agent": USER_AGENT}
+        cache = cache and data is None and method == "GET"
+        if cache:
+            with self._lock:
+                entry = self._get_cache.get(url)
+                generation = self._cache_generation
+            if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+                return entry[1], entry[2]
+        else:
+            self.invalidate_cache()
+
+        headers = {}
+        body = None
         if data is not None:
+            method = "POST"
             if multipart:
-                # DDTSS forms use multipart/form-data encoding
-                boundary = "----DDTPTranslateBoundary"
+                # The translation forms with textareas use multipart/form-data
                 parts = []
                 for key, value in data.items():
-                    parts.append(
-                        f"--{boundary}\r\n"
-                        f'Content-Disposition: form-data; name="{key}"\r\n\r\n'
-                        f"{value}\r\n"
+                    parts += (
+                        b"--", _BOUNDARY,
+                        b'\r\nContent-Disposition: form-data; name="', key.encode(),
+                        b'"\r\n\r\n', value.encode("utf-8"), b"\r\n",
                     )
-                parts.append(f"--{boundary}--\r\n")
-                body = "".join(parts).encode("utf-8")
-                headers["Content-Type"] = f"multipart/form-data; boundary={boundary}"
-                req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+                parts += (b"--", _BOUNDARY, b"--\r\n")
+                body = b"".join(parts)
+                headers["Content-Type"] = _MULTIPART_CONTENT_TYPE
             else:
-                encoded = urllib.parse.urlencode(data).encode("utf-8")
-                req = urllib.request.Request(url, data=encoded, headers=headers, method="POST")
-        else:
-            req = urllib.request.Request(url, headers=headers, method=method)
+                body = urllib.parse.urlencode(data).encode("utf-8")
+                headers["Content-Type"] = "application/x-www-form-urlencoded"
 
         try:
-            resp = self._opener.open(req, timeout=30)
-            body = resp.read().decode("utf-8", errors="replace")
-            return resp.status, body
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace") if e.fp else ""
-            return e.code, body
-        except urllib.error.URLError as e:
-            raise DDTSSError(f"Connection error: {e.reason}") from e
-
-    def _check_error(self, body):
-        """Check response body for known DDTSS error messages."""
-        # Parse for error in <h1> or plain text
-        error_patterns = {
-            "You must be logged in": DDTSSAuthError,
-            "Invalid username/password": DDTSSAuthError,
-            "Account not active yet": DDTSSAuthError,
-            "locked, sorry": DDTSSLockedError,
-            "gone, sorry": DDTSSNotFoundError,
-            "Couldn't fetch": DDTSSNotFoundError,
-            "didn't contain package name": DDTSSNotFoundError,
-            "Encoding error": DDTSSError,
-            "not complete, still <trans>": DDTSSValidationError,
-            "line longer than 80 characters": DDTSSValidationError,
-        }
-        for pattern, exc_class in error_patterns.items():
-            if pattern in body:
-                # Extract the full error message from <h1>
-                m = re.search(r"<h1>(.*?)</h1>", body, re.DOTALL)
-                msg = m.group(1).strip() if m else pattern
-                # Strip HTML tags from message
-                msg = re.sub(r"<[^>]+>", "", msg).strip()
-                raise exc_class(msg)
+            with _SESSION.open(url, method=method, body=body, headers=headers,
+                               allow_errors=True, cookiejar=self._cookie_jar) as resp:
+                status = resp.status
+                content = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            raise DDTSSError(f"Connection error: {e}") from e
+        # Any hop may have set or replaced the session cookie
+        self._refresh_id_cookie()
+        if cache and status == 200:
+            with self._lock:
+                if generation == self._cache_generation:
+                    self._get_cache[url] = (time.monotonic(), status, content)
+        return status, content
+
+    def invalidate_cache(self):
+        """Forget cached GET responses and their parsed results."""
+        with self._lock:
+            self._cache_generation += 1
+            self._get_cache.clear()
+            self._parse_memo.clear()
+
+    def _parse_once(self, key, body, parse):
+        """Return parse(body), reusing the last result while body is unchanged."""
+        with self._lock:
+            entry = self._parse_memo.get(key)
+        if entry is None or entry[0] is not body:
+            # Parsed outside the lock; a concurrent parse of the same
+            # body only does the work twice
+            entry = (body, parse(body))
+            with self._lock:
+                self._parse_memo[key] = entry
+        return entry[1]
+
+    def _check_error(self, body, form=None):
+        """Check a raw response body for known DDTSS error messages.
+
+        form is the page's _parse_form() result, if the caller already has
+        it; its <h1> text is then used as the message.
+        """
+        if not any(canary in body for canary in _ERROR_CANARIES):
+            return
+        # One scan finds every known message; the first in _ERROR_TABLE wins
+        found = {m.group() for m in _RE_ERRORS.finditer(body)}
+        if not found:
+            return
+        pattern, exc_class = next((p, cls) for raw, p, cls in _ERROR_TABLE if raw in found)
+        if form is not None:
+            raise exc_class(form.title.strip() or pattern)
+        # Extract the full error message from <h1>
+        m = _RE_H1.search(body)
+        msg = _decode(m.group(1)).strip() if m else pattern
+        # Strip HTML tags from message
+        msg = _RE_TAGS.sub("", msg).strip()
+        raise exc_class(msg)
 
     def login(self, alias, password):
         """Authenticate with the DDTSS.
@@ -236,34 +497,25 @@ class DDTSSClient:
             "password": password,
             "submit": "Submit",
         }
-        status, body = self._request(url, data=data, multipart=True)
+        status, body = self._request(url, data=data)
         self._check_error(body)
 
         # Successful login redirects to main page or shows logged-in status
-        if any(phrase in body for phrase in (
-            "Logged in as",
-            "logged in",
-            "Pending translation",
-            "Pending review",
-        )):
+        if any(phrase in body for phrase in _LOGIN_OK):
             self._save_cookies()
             return True
 
         # Check if we got a session cookie (redirect may have happened)
-        for cookie in self._cookie_jar:
-            if cookie.name == "id" and "ddtp.debian.org" in (cookie.domain or ""):
-                self._save_cookies()
-                return True
+        self._refresh_id_cookie()
+        if self._id_cookie is not None:
+            self._save_cookies()
+            return True
 
         raise DDTSSAuthError("Login failed (unexpected response)")
 
     def is_logged_in(self):
         """Check if we have a valid session cookie."""
-        for cookie in self._cookie_jar:
-            if cookie.name == "id" and "ddtp.debian.org" in (cookie.domain or ""):
-                if not cookie.is_expired():
-                    return True
-        return False
+        return self._id_cookie_expires > time.time()
 
     def fetch_package(self, package=None):
         """Fetch a package for translation.
@@ -283,30 +535,24 @@ class DDTSSClient:
         if package:
             url += f"?package={urllib.parse.quote(package)}"
 
-        status, body = self._request(url)
-        self._check_error(body)
+        status, raw = self._request(url)
+        body = _decode(raw)
+        form = _parse_form(body)
+        self._check_error(raw, form)
 
         # The fetch page redirects to /translate/<pkg> or /forreview/<pkg>
-        # Check for redirect URL in meta refresh or body
-        m = re.search(r'url=([^"]+/(?:translate|forreview)/([\w.+-]+))', body)
+        # with a meta refresh; HTTP redirects are already followed
+        m = form.refresh_url and _RE_FETCH_REDIRECT.search(form.refresh_url)
         if m:
-            redirect_url = m.group(1)
-            pkg_name = m.group(2)
-            if not redirect_url.startswith("http"):
-                redirect_url = f"{DDTSS_BASE}/{self.lang}/{redirect_url.split('/' + self.lang + '/')[-1]}"
-
+            redirect_url = urllib.parse.urljoin(url, form.refresh_url)
             # Follow the redirect to get the actual form
-            status, body = self._request(redirect_url)
-            self._check_error(body)
-            return self._parse_translate_page(body, pkg_name)
+            return self._load_translate_page(redirect_url, m.group(1))
 
         # Check if we got a translate page directly
-        parser = _FormParser()
-        parser.feed(body)
-        if parser.textareas:
-            pkg_match = re.search(r"translate/([\w.+-]+)", url)
+        if form.textareas:
+            pkg_match = _RE_TRANSLATE_LINK.search(url)
             pkg_name = pkg_match.group(1) if pkg_match else "unknown"
-            return self._parse_translate_page(body, pkg_name)
+            return self._parse_translate_page(body, pkg_name, form)
 
         raise DDTSSNotFoundError("No package available for translation")
 
@@ -317,39 +563,41 @@ class DDTSSClient:
             dict with keys: package, short_orig, long_orig, short_trans, long_trans
         """
         url = f"{DDTSS_BASE}/{self.lang}/translate/{urllib.parse.quote(package)}"
-        status, body = self._request(url)
-        self._check_error(body)
-        return self._parse_translate_page(body, package)
-
-    def _parse_translate_page(self, body, package):
-        """Parse the translate/review HTML page into structured data."""
-        parser = _FormParser()
-        parser.feed(body)
+        return self._load_translate_page(url, package)
+
+    def _load_translate_page(self, url, package):
+        """GET a translate/review page, check it for errors and parse it."""
+        status, raw = self._request(url)
+        body = _decode(raw)
+        form = _parse_form(body)
+        self._check_error(raw, form)
+        if form.textareas and "/translate/" in url:
+            with self._lock:
+                self._ready_translate.add(package)
+        return self._parse_translate_page(body, package, form)
+
+    def _parse_translate_page(self, body, package, form=None):
+        """Parse the translate/review HTML page into structured data.
+
+        form is the page's _parse_form() result, if the caller already has it.
+        """
+        if form is None:
+            form = _parse_form(body)
 
         result = {
             "package": package,
             "short_orig": "",
             "long_orig": "",
-            "short_trans": parser.textareas.get("short", parser.fields.get("short", "")),
-            "long_trans": parser.textareas.get("long", ""),
+            "short_trans": form.textareas.get("short", form.fields.get("short", "")),
+            "long_trans": form.textareas.get("long", ""),
         }
 
-        # Extract original description from the page
-        # It's usually in a <pre> or rendered text before the form
-        orig_short_m = re.search(
-            r"Description:\s*(.*?)(?:\n|<br)", body
-        )
-        if orig_short_m:
-            result["short_orig"] = orig_short_m.group(1).strip()
-
-        # Extract long original description
-        orig_long_m = re.search(
-            r'class=["\']?untranslated["\']?[^>]*>(.*?)</(?:pre|div|td)',
-            body, re.DOTALL
-        )
-        if orig_long_m:
-            text = re.sub(r"<[^>]+>", "", orig_long_m.group(1))
-            result["long_orig"] = text.strip()
+        # Original description, collected by the form parser
+        if form.description is not None:
+            result["short_orig"] = form.description
+
+        if form.untranslated is not None:
+            result["long_orig"] = form.untranslated.strip()
 
         return result
 
@@ -357,7 +605,9 @@ class DDTSSClient:
         """Submit a translated description.
 
         Automatically fetches the package first if needed (DDTSS requires
-        a fetch before the translate form is available).
+        a fetch before the translate form is available). If the form was
+        already loaded by fetch_package() or get_translate_page(), it is
+        posted directly.
 
         Args:
             package: Package name.
@@ -374,6 +624,33 @@ class DDTSSClient:
             DDTSSAuthError: Not logged in.
         """
         pkg_quoted = urllib.parse.quote(package)
+        translate_url = f"{DDTSS_BASE}/{self.lang}/translate/{pkg_quoted}"
+        data = {
+            "short": short,
+            "long": long,
+            "comment": comment,
+            "submit": "Submit",
+            "_charset_": "UTF-8",
+        }
+
+        # Taken atomically, so two threads cannot both use the loaded form
+        with self._lock:
+            form_loaded = package in self._ready_translate
+            self._ready_translate.discard(package)
+        if form_loaded:
+            # A transport error is raised as is: the POST may have arrived,
+            # and posting again could submit the translation twice
+            status, body = self._request(translate_url, data=data, multipart=True)
+            try:
+                self._check_error(body)
+            except DDTSSValidationError:
+                raise
+            except DDTSSError:
+                # DDTSS refused the old form (e.g. it expired); fetch the
+                # package and re-read the translate page before posting
+                pass
+            else:
+                return self._translation_posted(status, body)
 
         # Step 1: Fetch the package to ensure translate form is available
         fetch_url = f"{DDTSS_BASE}/{self.lang}/fetch?package={pkg_quoted}"
@@ -381,28 +658,25 @@ class DDTSSClient:
         self._check_error(f_body)
 
         # Step 2: GET the translate page to confirm it's ready
-        translate_url = f"{DDTSS_BASE}/{self.lang}/translate/{pkg_quoted}"
         g_status, g_body = self._request(translate_url)
         self._check_error(g_body)
 
         # Verify we got the actual translate form, not a "Fetching..." page
-        if "Fetching package" in g_body:
+        if "Fetching package" in _decode(g_body):
             raise DDTSSError(f"Package {package} not available for translation")
 
         # Step 3: POST the translation
-        data = {
-            "short": short,
-            "long": long,
-            "comment": comment,
-            "submit": "Submit",
-            "_charset_": "UTF-8",
-        }
+        return self._post_translation(translate_url, data)
 
+    def _post_translation(self, translate_url, data):
         status, body = self._request(translate_url, data=data, multipart=True)
         self._check_error(body)
+        return self._translation_posted(status, body)
 
+    def _translation_posted(self, status, body):
+        """Return True for a successful translation POST, else raise."""
         # Check for success confirmation
-        if "submitted" in body.lower():
+        if _RE_SUBMITTED.search(body):
             return True
 
         # If no error was raised and we got HTTP 200, treat as success
@@ -418,41 +692,10 @@ class DDTSSClient:
             list of dicts with keys: package, timestamp, note, owner
         """
         url = f"{DDTSS_BASE}/{self.lang}/"
-        status, body = self._request(url)
-
-        reviews = []
-        # Parse "Pending review" section
-        review_section = re.search(
-            r'Pending review.*?<ol>(.*?)</ol>', body, re.DOTALL
-        )
-        if review_section:
-            for m in re.finditer(
-                r'forreview/([\w.+-]+)\?(\d+)">([\w.+-]+)</a>\s*\(([^)]*)\)',
-                review_section.group(1)
-            ):
-                reviews.append({
-                    "package": m.group(1),
-                    "timestamp": m.group(2),
-                    "note": m.group(4),
-                })
-
-        # Also parse "Reviewed by you" section
-        reviewed_section = re.search(
-            r'Reviewed by you.*?<ol>(.*?)</ol>', body, re.DOTALL
-        )
-        if reviewed_section:
-            for m in re.finditer(
-                r'forreview/([\w.+-]+)\?(\d+)">([\w.+-]+)</a>\s*\(([^)]*)\)',
-                reviewed_section.group(1)
-            ):
-                reviews.append({
-                    "package": m.group(1),
-                    "timestamp": m.group(2),
-                    "note": m.group(4),
-                    "reviewed_by_you": True,
-                })
-
-        return reviews
+        status, body = self._request(url, cache=True)
+        return list(self._parse_once(
+            ("reviews", url), body, lambda b: _parse_pending_reviews(_decode(b))
+        ))
 
     def get_review_page(self, package):
         """Get the review form for a specific package.
@@ -462,46 +705,79 @@ class DDTSSClient:
                             owner, reviewers, log, diff_html, comment
         """
         url = f"{DDTSS_BASE}/{self.lang}/forreview/{urllib.parse.quote(package)}"
-        status, body = self._request(url)
-        self._check_error(body)
-
-        parser = _FormParser()
-        parser.feed(body)
+        status, raw = self._request(url, cache=True)
+        body = _decode(raw)
+        form = _parse_form(body)
+        self._check_error(raw, form)
 
         result = {
             "package": package,
             "short_orig": "",
             "long_orig": "",
-            "short_trans": parser.fields.get("short", ""),
-            "long_trans": parser.textareas.get("long", ""),
-            "comment": parser.textareas.get("comment", ""),
+            "short_trans": form.fields.get("short", ""),
+            "long_trans": form.textareas.get("long", ""),
+            "comment": form.textareas.get("comment", ""),
             "owner": "",
             "log": "",
         }
 
-        # Extract original short description
-        orig_short_m = re.search(r'Untranslated:\s*<tt>(.*?)</tt>', body)
-        if orig_short_m:
-            from html import unescape
-            result["short_orig"] = unescape(orig_short_m.group(1).strip())
-
-        # Extract original long description from <pre> in untranslated
-        orig_long_m = re.search(r'Untranslated:.*?<pre>(.*?)</pre>', body, re.DOTALL)
-        if orig_long_m:
-            result["long_orig"] = orig_long_m.group(1).strip()
+        # Original descriptions, as text collected by the form parser
+        if form.untranslated_short is not None:
+            result["short_orig"] = form.untranslated_short.strip()
+        if form.untranslated_long is not None:
+            result["long_orig"] = form.untranslated_long.strip()
 
         # Extract owner
-        owner_m = re.search(r'the owner is:\s*<b>(.*?)</b>', body)
+        owner_m = _RE_OWNER.search(body)
         if owner_m:
             result["owner"] = owner_m.group(1)
 
         # Extract log
-        log_m = re.search(r'Log:\s*<pre>(.*?)</pre>', body, re.DOTALL)
+        log_m = _RE_LOG.search(body)
         if log_m:
             result["log"] = log_m.group(1).strip()
 
         return result
 
+    def get_review_pages(self, packages):
+        """Load the review pages of several packages in parallel.
+
+        Returns a list of get_review_page() results in the order of
+        packages; packages whose page could not be loaded are left out.
+        """
+        return self._batch(self.get_review_page, packages)
+
+    def prefetch_next(self, n):
+        """Fetch up to n packages for translation in parallel.
+
+        Returns a list of fetch_package() results, without duplicates.
+        Fewer than n are returned if DDTSS has no more packages to hand out.
+        """
+        seen = set()
+        result = []
+        for entry in self._batch(lambda _i: self.fetch_package(), range(n)):
+            if entry["package"] not in seen:
+                seen.add(entry["package"])
+                result.append(entry)
+        return result
+
+    def _batch(self, func, items):
+        """Run func over items on a thread pool, dropping DDTSS failures.
+
+        The workers take connections from _SESSION's shared per-host idle
+        pool, one each while a request runs, and the cookie jar is locked
+        internally, so the requests can overlap.
+        """
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+            futures = [pool.submit(func, item) for item in items]
+        result = []
+        for future in futures:
+            try:
+                result.append(future.result())
+            except DDTSSError:
+                continue
+        return result
+
     def submit_review(self, package, action="accept", short="", long="", comment=""):
         """Submit a review for a translation.
 
@@ -530,7 +806,9 @@ class DDTSSClient:
         else:
             raise ValueError(f"Unknown review action: {action}")
 
-        status, body = self._request(url, data=data, multipart=True)
+        # Only the edited description needs multipart; the other actions
+        # are small key/value forms
+        status, body = self._request(url, data=data, multipart=action == "changes")
         self._check_error(body)
         return True
 
@@ -545,7 +823,9 @@ class DDTSSClient:
         """
         url = f"{DDTSS_BASE}/{self.lang}/translate/{urllib.parse.quote(package)}"
         data = {"abandon": "Abandon", "_charset_": "UTF-8"}
-        status, body = self._request(url, data=data, multipart=True)
+        with self._lock:
+            self._ready_translate.discard(package)
+        status, body = self._request(url, data=data)
         self._check_error(body)
         return True
 
@@ -559,7 +839,8 @@ class DDTSSClient:
             translated: set of package names that have been translated
         """
         url = f"{DDTSS_BASE}/{self.lang}/"
-        status, body = self._request(url)
+        status, body = self._request(url, cache=True)
+        body = _decode(body)
 
         result = {
             "pending_translation": [],
@@ -568,22 +849,15 @@ class DDTSSClient:
         }
 
         # Parse "Pending translation" section
-        pending_trans = re.search(
-            r'Pending translation.*?<ol>(.*?)</ol>', body, re.DOTALL
-        )
+        pending_trans = _RE_PENDING_TRANSLATION.search(body)
         if pending_trans:
-            for m in re.finditer(r'translate/([\w.+-]+)', pending_trans.group(1)):
+            for m in _RE_TRANSLATE_LINK.finditer(pending_trans.group(1)):
                 result["pending_translation"].append(m.group(1))
 
         # Parse "Pending review" section
-        review_section = re.search(
-            r'Pending review.*?<ol>(.*?)</ol>', body, re.DOTALL
-        )
+        review_section = _RE_PENDING_REVIEW.search(body)
         if review_section:
-            for m in re.finditer(
-                r'forreview/([\w.+-]+)\?(\d+)">([\w.+-]+)</a>\s*\(([^)]*)\)',
-                review_section.group(1)
-            ):
+            for m in _RE_REVIEW_ITEM.finditer(review_section.group(1)):
                 result["pending_review"].append({
                     "package": m.group(1),
                     "note": m.group(4),
@@ -591,14 +865,9 @@ class DDTSSClient:
                 })
 
         # Parse "Reviewed by you" section
-        reviewed_section = re.search(
-            r'Reviewed by you.*?<ol>(.*?)</ol>', body, re.DOTALL
-        )
+        reviewed_section = _RE_REVIEWED_BY_YOU.search(body)
         if reviewed_section:
-            for m in re.finditer(
-                r'forreview/([\w.+-]+)\?(\d+)">([\w.+-]+)</a>\s*\(([^)]*)\)',
-                reviewed_section.group(1)
-            ):
+            for m in _RE_REVIEW_ITEM.finditer(reviewed_section.group(1)):
                 result["pending_review"].append({
                     "package": m.group(1),
                     "note": m.group(4),
@@ -606,11 +875,9 @@ class DDTSSClient:
                 })
 
         # Parse "Recently DDTP'd" section (successfully reviewed and sent)
-        recently = re.search(
-            r'Recently DDTP.*?<ol>(.*?)</ol>', body, re.DOTALL
-        )
+        recently = _RE_RECENTLY_DDTPD.search(body)
         if recently:
-            for m in re.finditer(r'>([\w.+-]+)</(?:a|li)', recently.group(1)):
+            for m in _RE_RECENT_ITEM.finditer(recently.group(1)):
                 result["recently_reviewed"].append({
                     "package": m.group(1),
                     "status": "done",
@@ -625,22 +892,50 @@ class DDTSSClient:
             dict with keys: pending_translation, pending_review, sent
         """
         url = f"{DDTSS_BASE}/{self.lang}/"
-        status, body = self._request(url)
-
-        stats = {
-            "pending_translation": 0,
-            "pending_review": 0,
-            "sent": 0,
-        }
-
-        # Parse stats table from main page
-        m = re.search(
-            r"Pending translation.*?(\d+).*?Pending review.*?(\d+).*?Sent.*?(\d+)",
-            body, re.DOTALL
-        )
-        if m:
-            stats["pending_translation"] = int(m.group(1))
-            stats["pending_review"] = int(m.group(2))
-            stats["sent"] = int(m.group(3))
-
-        return stats
+        status, body = self._request(url, cache=True)
+        return dict(self._parse_once(("stats", url), body, _parse_stats))
+
+
+def _parse_pending_reviews(body):
+    """Parse the pending review lists from a DDTSS language main page."""
+    reviews = []
+    # Parse "Pending review" section
+    review_section = _RE_PENDING_REVIEW.search(body)
+    if review_section:
+        for m in _RE_REVIEW_ITEM.finditer(review_section.group(1)):
+            reviews.append({
+                "package": m.group(1),
+                "timestamp": m.group(2),
+                "note": m.group(4),
+            })
+
+    # Also parse "Reviewed by you" section
+    reviewed_section = _RE_REVIEWED_BY_YOU.search(body)
+    if reviewed_section:
+        for m in _RE_REVIEW_ITEM.finditer(reviewed_section.group(1)):
+            reviews.append({
+                "package": m.group(1),
+                "timestamp": m.group(2),
+                "note": m.group(4),
+                "reviewed_by_you": True,
+            })
+
+    return reviews
+
+
+def _parse_stats(body):
+    """Parse the statistics table from a raw DDTSS language main page."""
+    stats = {
+        "pending_translation": 0,
+        "pending_review": 0,
+        "sent": 0,
+    }
+
+    # Parse stats table from main page
+    m = _RE_STATS.search(body)
+    if m:
+        stats["pending_translation"] = int(m.group(1))
+        stats["pending_review"] = int(m.group(2))
+        stats["sent"] = int(m.group(3))
+
+    return stats
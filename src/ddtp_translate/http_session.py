@@ -0,0 +1,190 @@
+"""Keep-alive HTTP session shared by the DDTP and DDTSS clients.
+
+urllib.request opens a new TCP+TLS connection for every request and
+sends "Connection: close". HTTPSession keeps idle http.client
+connections per host instead, shared by all threads, so repeated
+requests to the same server skip the handshake even when they run on
+different worker threads. Connect and read timeouts are separate, and
+requests that fail at the connection level are retried with backoff.
+"""
+
+import contextlib
+import http.client
+import ssl
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+# Idle connections kept per host; more are closed when returned
+MAX_IDLE_PER_HOST = 4
+# Unread bodies up to this size are drained so the connection stays usable
+_DRAIN_LIMIT = 64 * 1024
+# Errors that mean a reused connection was closed before the response
+# started. RemoteDisconnected is a ConnectionResetError.
+_STALE_ERRORS = (BrokenPipeError, ConnectionResetError)
+
+
+class HTTPStatusError(OSError):
+    """The server answered with an HTTP error status (4xx/5xx)."""
+
+    def __init__(self, url, status, reason=""):
+        super().__init__(f"HTTP {status} {reason} for {url}".strip())
+        self.url = url
+        self.status = status
+
+
+class HTTPSession:
+    """Pool of persistent HTTP(S) connections, kept per host.
+
+    A connection is used by one request at a time: it is taken out of
+    the pool for the request and put back once the response is read.
+    """
+
+    def __init__(self, user_agent, connect_timeout=5, read_timeout=60,
+                 retries=3, backoff_factor=0.5):
+        self.user_agent = user_agent
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._pools = {}  # (scheme, netloc) -> idle connections
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    def _new_connection(self, scheme, netloc):
+        host, _sep, port = netloc.rpartition(":")
+        if not host or not port.isdigit():
+            host, port = netloc, None
+        port = int(port) if port else None
+
+        proxy = urllib.request.getproxies().get(scheme)
+        if proxy and not urllib.request.proxy_bypass(host):
+            target = urllib.parse.urlsplit(proxy)
+            conn_host, conn_port = target.hostname, target.port
+        else:
+            proxy = None
+            conn_host, conn_port = host, port
+
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                conn_host, conn_port, timeout=self.connect_timeout,
+                context=self._ssl_context,
+            )
+        else:
+            conn = http.client.HTTPConnection(
+                conn_host, conn_port, timeout=self.connect_timeout,
+            )
+        if proxy:
+            conn.set_tunnel(host, port)
+        return conn
+
+    def _checkout(self, key):
+        """Take an idle connection for key, or open a new one."""
+        with self._lock:
+            idle = self._pools.get(key)
+            if idle:
+                return idle.pop()
+        return self._new_connection(*key)
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            idle = self._pools.setdefault(key, [])
+            if len(idle) < MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(self, method, url, body, headers, read_timeout):
+        """Send one request, retrying connection-level failures."""
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        all_headers = {"User-Agent": self.user_agent}
+        all_headers.update(headers or {})
+
+        attempt = 0
+        while True:
+            conn = self._checkout(key)
+            reused = conn.sock is not None
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                conn.sock.settimeout(read_timeout)
+                conn.request(method, path, body=body, headers=all_headers)
+                return key, conn, conn.getresponse()
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                # A reused keep-alive socket may simply have been closed by
+                # the server, which shows as a disconnect before any response.
+                # Only then may a POST be resent; after a timeout the server
+                # may already have acted on it.
+                idempotent = method in ("GET", "HEAD")
+                stale = reused and attempt == 0 and isinstance(exc, _STALE_ERRORS)
+                if attempt >= self.retries or not (idempotent or stale):
+                    raise
+                if attempt:
+                    time.sleep(self.backoff_factor * (2 ** (attempt - 1)))
+                attempt += 1
+
+    @contextlib.contextmanager
+    def open(self, url, method="GET", body=None, headers=None,
+             read_timeout=None, allow_errors=False, cookiejar=None):
+        """Perform a request and yield the http.client.HTTPResponse.
+
+        Up to MAX_REDIRECTS redirects are followed; more raise
+        HTTPStatusError. Unless allow_errors is set, a 4xx/5xx
+        status raises HTTPStatusError. If a http.cookiejar.CookieJar is
+        given, its cookies are sent and Set-Cookie headers stored on every
+        hop. The response must be used inside the with-block; a body that
+        is left unread closes the connection.
+        """
+        if read_timeout is None:
+            read_timeout = self.read_timeout
+
+        for _hop in range(MAX_REDIRECTS + 1):
+            send_headers = headers
+            if cookiejar is not None:
+                cookie_req = urllib.request.Request(url, headers=headers or {}, method=method)
+                cookiejar.add_cookie_header(cookie_req)
+                send_headers = dict(cookie_req.header_items())
+            key, conn, resp = self._send(method, url, body, send_headers, read_timeout)
+            if cookiejar is not None:
+                cookiejar.extract_cookies(resp, cookie_req)
+            location = resp.getheader("Location")
+            if resp.status not in REDIRECT_CODES or not location:
+                break
+            self._release(key, conn, resp)
+            url = urllib.parse.urljoin(url, location)
+            if resp.status == 303 or (resp.status in (301, 302) and method == "POST"):
+                method, body = "GET", None
+                headers = {k: v for k, v in (headers or {}).items()
+                           if k.lower() != "content-type"}
+        else:
+            # The last redirect response was already released above
+            raise HTTPStatusError(url, resp.status, "too many redirects")
+
+        try:
+            if resp.status >= 400 and not allow_errors:
+                raise HTTPStatusError(url, resp.status, resp.reason)
+            yield resp
+        finally:
+            self._release(key, conn, resp)
+
+    def _release(self, key, conn, resp):
+        """Return the connection to the pool, or close it if it is dirty."""
+        if not resp.isclosed() and resp.length is not None and resp.length <= _DRAIN_LIMIT:
+            try:
+                resp.read()
+            except (OSError, http.client.HTTPException):
+                pass
+        if resp.isclosed():
+            self._checkin(key, conn)
+        else:
+            resp.close()
+            conn.close()
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """DDTP Translate — GTK4/Adwaita app for translating Debian package descriptions."""
 
+import collections
+import functools
 import gettext
+import io
 import locale
+import mmap
 import os
 import re
 import shutil
@@ -11,18 +15,28 @@ import sys
 import tempfile
 import threading
 import time
+from concurrent.futures import Future, as_completed
+from queue import Empty, SimpleQueue
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Adw, Gio, GLib, Gtk, Gdk, Pango  # noqa: E402
+from gi.repository import Adw, Gio, GLib, GObject, Gtk, Gdk, Pango  # noqa: E402
 
 from . import __version__
-from .ddtp_api import DDTP_LANGUAGES, fetch_untranslated, fetch_ddtp_stats, fetch_popcon_data
+from .ddtp_api import (
+    DDTP_LANGUAGES, DDTP_LANGUAGE_NAMES, fetch_untranslated, fetch_ddtp_stats, fetch_popcon_data,
+    load_cached_untranslated,
+)
 from .settings import load_settings, save_settings
 from .ddtss_client import (
-    DDTSSClient, DDTSSError, DDTSSAuthError,
+    BATCH_WORKERS, DDTSSClient, DDTSSError, DDTSSAuthError,
     DDTSSLockedError, DDTSSValidationError,
 )
 from .accessibility import AccessibilityManager
@@ -46,87 +60,288 @@ for d in [
 locale.bindtextdomain("ddtp-translate", LOCALE_DIR)
 gettext.bindtextdomain("ddtp-translate", LOCALE_DIR)
 gettext.textdomain("ddtp-translate")
-_ = gettext.gettext
+_gettext = gettext.gettext
+
+
+@functools.lru_cache(maxsize=4096)
+def _(message):
+    """Translate message; msgid lookups are memoised."""
+    return _gettext(message)
+
+
+def _invalidate_translations():
+    """Forget memoised translations, e.g. after switching the UI language."""
+    _.cache_clear()
+
 
 APP_ID = "se.danielnylander.ddtp-translate"
 
+class _DaemonExecutor:
+    """A small thread pool whose workers are daemon threads.
+
+    concurrent.futures joins ThreadPoolExecutor workers at interpreter
+    exit, so a job blocked on the network would keep the process alive
+    after the window is closed until its socket timed out. Daemon
+    workers end with the process, like the plain threads used before.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix="ddtp-worker"):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._jobs = SimpleQueue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.shutdown()
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self._jobs.put((future, fn, args, kwargs))
+        with self._lock:
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._work, daemon=True,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}")
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, fn, args, kwargs = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """Stop the workers once the queued jobs are done.
+
+        With cancel_futures, jobs that have not started are dropped.
+        """
+        if cancel_futures:
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except Empty:
+                    break
+                if job is not None:
+                    job[0].cancel()
+        with self._lock:
+            threads = list(self._threads)
+        for _thread in threads:
+            self._jobs.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+# Shared pool for short background jobs (DDTSS requests, lint runs),
+# so each click does not start a fresh thread
+_EXECUTOR = _DaemonExecutor(
+    max_workers=min(8, (os.cpu_count() or 4) * 2), thread_name_prefix="ddtp-io")
+
+# Session flags per package, combined in MainWindow._pkg_flags
+PKG_SUBMITTED = 1
+PKG_MODIFIED = 2
+PKG_ERROR = 4
+
+# Queue changes within this many milliseconds are written to disk once
+QUEUE_SAVE_DELAY_MS = 500
+
+# Background results arriving within this many milliseconds update the
+# package list once
+REFRESH_COALESCE_MS = 50
+
+# Load errors that mean the servers could not be reached at all
+_NETWORK_ERR_RE = re.compile(r"urlopen|Connection refused|timed out|unreachable", re.IGNORECASE)
+
+# Sort rank of each DDTSS status for the "status" sort mode
+_STATUS_SORT_ORDER = {"none": 0, "pending": 1, "reviewed_comment": 2, "reviewed_ok": 3}
+
 # --- Data directory helpers ---
 
+_PO_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\t": "\\t"})
+
 def _po_escape(s):
     """Escape a string for use in a PO file msgid/msgstr."""
-    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return s.translate(_PO_ESCAPE_TABLE)
+
+def _po_quote(s):
+    """Quote a PO string, splitting multi-line text into continuation lines."""
+    lines = s.split("\n")
+    if len(lines) == 1:
+        return f'"{_po_escape(s)}"'
+    parts = ['""']
+    for line in lines[:-1]:
+        parts.append(f'"{_po_escape(line)}\\n"')
+    parts.append(f'"{_po_escape(lines[-1])}"')
+    return "\n".join(parts)
+
+def _write_po_entry(buf, msgid, msgstr="", msgctxt=None, comments=()):
+    """Write one PO entry, followed by a blank line, to a text buffer."""
+    for comment in comments:
+        buf.write(f"#. {comment}\n")
+    if msgctxt is not None:
+        buf.write(f'msgctxt "{_po_escape(msgctxt)}"\n')
+    buf.write("msgid ")
+    buf.write(_po_quote(msgid))
+    buf.write("\nmsgstr ")
+    buf.write(_po_quote(msgstr))
+    buf.write("\n\n")
+
+# One msgid/msgstr pair with its continuation lines, matched over the whole file
+_PO_STRING = rb'"((?:[^"\\\n]|\\.)*)"[ \t]*((?:\n"(?:[^"\\\n]|\\.)*"[ \t]*)*)'
+_PO_ENTRY_RE = re.compile(
+    rb"^msgid[ \t]+" + _PO_STRING + rb"\nmsgstr[ \t]+" + _PO_STRING, re.MULTILINE
+)
+_PO_CONTINUATION_RE = re.compile(rb'\n"((?:[^"\\\n]|\\.)*)"')
+_PO_UNESCAPE_RE = re.compile(rb"\\(.)")
+_PO_UNESCAPES = {b"n": b"\n", b"t": b"\t", b'"': b'"', b"\\": b"\\"}
+
+def _po_unescape(first, continuation):
+    """Join a PO string with its continuation lines and unescape it."""
+    if continuation:
+        first += b"".join(_PO_CONTINUATION_RE.findall(continuation))
+    if b"\\" in first:
+        first = _PO_UNESCAPE_RE.sub(
+            lambda m: _PO_UNESCAPES.get(m.group(1), m.group()), first
+        )
+    return first.decode("utf-8")
 
 def _parse_po_entries(path):
     """Parse a .po file and return list of (msgid, msgstr) tuples, skipping the header."""
     entries = []
-    current_id = []
-    current_str = []
-    in_msgid = False
-    in_msgstr = False
-
-    def _unescape(s):
-        return s.replace("\\n", "\n").replace('\\"', '"').replace("\\\\", "\\")
-
-    def _flush():
-        mid = _unescape("".join(current_id))
-        mstr = _unescape("".join(current_str))
-        if mid:  # skip header (empty msgid)
-            entries.append((mid, mstr))
-
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.rstrip("\n")
-            if line.startswith("msgid "):
-                if in_msgstr:
-                    _flush()
-                    current_id.clear()
-                    current_str.clear()
-                in_msgid = True
-                in_msgstr = False
-                s = line[6:].strip()
-                if s.startswith('"') and s.endswith('"'):
-                    current_id.append(s[1:-1])
-            elif line.startswith("msgstr "):
-                in_msgid = False
-                in_msgstr = True
-                s = line[7:].strip()
-                if s.startswith('"') and s.endswith('"'):
-                    current_str.append(s[1:-1])
-            elif line.startswith('"') and line.endswith('"'):
-                s = line[1:-1]
-                if in_msgid:
-                    current_id.append(s)
-                elif in_msgstr:
-                    current_str.append(s)
-        if in_msgstr:
-            _flush()
-
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return entries
+        # Scan the page cache directly instead of copying the file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for m in _PO_ENTRY_RE.finditer(data):
+                mid = _po_unescape(m.group(1), m.group(2))
+                if mid:  # skip header (empty msgid)
+                    entries.append((mid, _po_unescape(m.group(3), m.group(4))))
     return entries
 
+@functools.cache
 def _data_dir():
     xdg = os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share"))
     d = os.path.join(xdg, "ddtp-translate")
     os.makedirs(d, exist_ok=True)
     return d
 
+@functools.cache
 def _queue_path():
     return os.path.join(_data_dir(), "queue.json")
 
+@functools.cache
 def _log_path():
     return os.path.join(_data_dir(), "events.log")
 
+# Paths of external tools that have been found; a missing tool is
+# looked up again next time, so installing it needs no restart
+_tool_paths = {}
+
+def _find_tool(name):
+    """Return the path of an external tool, or None if it is not installed."""
+    path = _tool_paths.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _tool_paths[name] = path
+    return path
+
+def _run_l10n_lint(po_text, timeout):
+    """Run l10n-lint over PO text and return the CompletedProcess.
+
+    l10n-lint only reads files, so the text goes through a temporary
+    .po file, which is removed even if the run fails.
+    """
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".po", encoding="utf-8") as f:
+        f.write(po_text)
+        f.flush()
+        return subprocess.run(
+            ["l10n-lint", "--format", "text", f.name],
+            capture_output=True, text=True, timeout=timeout,
+        )
+
+# Cached "enable_logging" setting; None until it is first needed
+_logging_enabled = None
+
+def _set_logging_enabled(enabled):
+    global _logging_enabled
+    _logging_enabled = bool(enabled)
+
+# Log lines are handed to one writer thread instead of opening the file per event
+_log_lines = SimpleQueue()
+_log_writer_thread = None
+_log_writer_lock = threading.Lock()
+
+def _log_writer():
+    """Append queued log lines to the event log, one write per burst.
+
+    A threading.Event in the queue is set once everything queued before
+    it has been written; _flush_log() uses that at exit.
+    """
+    f = None
+    while True:
+        batch = [_log_lines.get()]
+        while True:
+            try:
+                batch.append(_log_lines.get_nowait())
+            except Empty:
+                break
+        lines = [x for x in batch if isinstance(x, str)]
+        if lines:
+            try:
+                if f is None:
+                    f = open(_log_path(), "a", encoding="utf-8")
+                f.write("".join(lines))
+                f.flush()
+            except OSError:
+                if f is not None:
+                    try:
+                        f.close()
+                    except OSError:
+                        pass
+                f = None
+        for x in batch:
+            if isinstance(x, threading.Event):
+                x.set()
+
+def _flush_log(timeout=2.0):
+    """Wait until the writer thread has written every queued log line."""
+    if _log_writer_thread is None:
+        return
+    done = threading.Event()
+    _log_lines.put(done)
+    done.wait(timeout)
+
 def _log_event(message):
     """Log an event if logging is enabled."""
-    settings = load_settings()
-    if not settings.get("enable_logging", False):
+    global _log_writer_thread
+    if _logging_enabled is None:
+        _set_logging_enabled(load_settings().get("enable_logging", False))
+    if not _logging_enabled:
         return
     import datetime
-    try:
-        with open(_log_path(), "a", encoding="utf-8") as f:
-            ts = datetime.datetime.now().isoformat(timespec="seconds")
-            f.write(f"[{ts}] {message}\n")
-    except OSError:
-        pass
+    ts = datetime.datetime.now().isoformat(timespec="seconds")
+    _log_lines.put(f"[{ts}] {message}\n")
+    if _log_writer_thread is None:
+        with _log_writer_lock:
+            if _log_writer_thread is None:
+                _log_writer_thread = threading.Thread(target=_log_writer, daemon=True)
+                _log_writer_thread.start()
 
 def _format_ddtss_note(note):
     """Format DDTSS note string into user-friendly text.
@@ -155,8 +370,7 @@ def _format_ddtss_note(note):
     return note
 
 def _save_queue(queue):
-    """Persist queue to disk."""
-    import json
+    """Persist queue to disk, using orjson when it is installed."""
     data = []
     for item in queue:
         data.append({
@@ -167,11 +381,27 @@ def _save_queue(queue):
             "status": item.status,
             "error_msg": item.error_msg,
         })
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        import json
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    # Write a temporary file and rename it over the queue, so an
+    # interrupted write never leaves a truncated queue.json behind
+    path = _queue_path()
     try:
-        with open(_queue_path(), "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix="queue.json", suffix=".tmp")
     except OSError:
-        pass
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
 
 def _load_queue():
     """Load queue from disk."""
@@ -180,8 +410,9 @@ def _load_queue():
     if not os.path.exists(path):
         return []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         items = []
         for d in data:
             item = QueueItem(d["package"], d["md5"], d["short"], d.get("long_text", ""))
@@ -189,11 +420,10 @@ def _load_queue():
             item.error_msg = d.get("error_msg", "")
             items.append(item)
         return items
-    except (OSError, json.JSONDecodeError, KeyError):
+    except (OSError, ValueError, KeyError):
         return []
 
-def _setup_css():
-    css = b"""
+_CSS = b"""
     .heatmap-green { background-color: #26a269; color: white; border-radius: 8px; }
     .heatmap-red { background-color: #c01c28; color: white; border-radius: 8px; }
     .heatmap-gray { background-color: #77767b; color: white; border-radius: 8px; }
@@ -216,15 +446,32 @@ def _setup_css():
     .pkg-banner { padding: 4px 12px; }
     .compact-row { padding: 2px 6px; }
     """
+
+# Displays that already have the app stylesheet
+_css_displays = set()
+
+def _setup_css():
+    """Install the app stylesheet on the default display, once."""
+    display = Gdk.Display.get_default()
+    if display in _css_displays:
+        return
     provider = Gtk.CssProvider()
-    provider.load_from_data(css)
+    provider.load_from_bytes(GLib.Bytes.new(_CSS))
     Gtk.StyleContext.add_provider_for_display(
-        Gdk.Display.get_default(), provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        display, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+    _css_displays.add(display)
+
+def _set_label_once(widget, label):
+    """GLib source callback: set a label and remove the source."""
+    widget.set_label(label)
+    return GLib.SOURCE_REMOVE
 
 # --- Queue item ---
 
 class QueueItem:
     """A translation queued for submission."""
+    __slots__ = ("package", "md5", "short", "long_text", "status", "error_msg")
+
     STATUS_READY = "ready"
     STATUS_SENDING = "sending"
     STATUS_SENT = "sent"
@@ -238,6 +485,34 @@ class QueueItem:
         self.status = self.STATUS_READY
         self.error_msg = ""
 
+class QueueItemObject(GObject.Object):
+    """A QueueItem in the queue dialog's list model."""
+    __gtype_name__ = "DdtpQueueItem"
+
+    def __init__(self, item):
+        super().__init__()
+        self.item = item
+
+class ReviewObject(GObject.Object):
+    """A DDTSS review entry in the review dialog's list model."""
+    __gtype_name__ = "DdtpReviewItem"
+
+    def __init__(self, review):
+        super().__init__()
+        self.review = review
+
+# --- Package list item ---
+
+class PackageItem(GObject.Object):
+    """A package in the sidebar list model."""
+    __gtype_name__ = "DdtpPackageItem"
+
+    name = GObject.Property(type=str, default="")
+
+    def __init__(self, pkg):
+        super().__init__(name=pkg["package"])
+        self.pkg = pkg
+
 # --- Preferences Window ---
 
 class PreferencesWindow(Adw.PreferencesWindow):
@@ -286,10 +561,9 @@ class PreferencesWindow(Adw.PreferencesWindow):
         )
 
         self.max_pkg_row = Adw.ComboRow(title=_("Max packages to display"))
-        max_pkg_model = Gtk.StringList()
         self._max_pkg_values = [500, 1000, 5000, 0]
-        for v in self._max_pkg_values:
-            max_pkg_model.append(str(v) if v > 0 else _("All"))
+        max_pkg_model = Gtk.StringList.new(
+            [str(v) if v > 0 else _("All") for v in self._max_pkg_values])
         self.max_pkg_row.set_model(max_pkg_model)
         current_max = self.settings.get("max_packages", 500)
         if current_max in self._max_pkg_values:
@@ -340,10 +614,9 @@ class PreferencesWindow(Adw.PreferencesWindow):
         )
 
         self.default_sort_row = Adw.ComboRow(title=_("Default sort mode"))
-        sort_model = Gtk.StringList()
         self._sort_mode_values = ["alpha", "status", "popcon"]
-        for label in [_("Alphabetical"), _("By status"), _("By popularity (popcon)")]:
-            sort_model.append(label)
+        sort_model = Gtk.StringList.new(
+            [_("Alphabetical"), _("By status"), _("By popularity (popcon)")])
         self.default_sort_row.set_model(sort_model)
         current_sort = self.settings.get("sort_mode", "alpha")
         if current_sort in self._sort_mode_values:
@@ -365,21 +638,21 @@ class PreferencesWindow(Adw.PreferencesWindow):
         password = self.ddtss_pass_row.get_text().strip()
         if not alias or not password:
             btn.set_label(_("Enter alias and password first"))
-            GLib.timeout_add(2000, lambda: btn.set_label(_("Test Login")) or False)
+            GLib.timeout_add(2000, _set_label_once, btn, _("Test Login"))
             return
 
         def _do_test():
             try:
                 client = DDTSSClient()
                 client.login(alias, password)
-                GLib.idle_add(lambda: btn.set_label("✅ " + _("Login successful!")) or False)
+                GLib.idle_add(_set_label_once, btn, "✅ " + _("Login successful!"))
             except DDTSSAuthError as e:
-                GLib.idle_add(lambda: btn.set_label(f"❌ {e}") or False)
+                GLib.idle_add(_set_label_once, btn, f"❌ {e}")
             except DDTSSError as e:
-                GLib.idle_add(lambda: btn.set_label(f"❌ {e}") or False)
-            GLib.timeout_add(3000, lambda: btn.set_label(_("Test Login")) or False)
+                GLib.idle_add(_set_label_once, btn, f"❌ {e}")
+            GLib.timeout_add(3000, _set_label_once, btn, _("Test Login"))
 
-        threading.Thread(target=_do_test, daemon=True).start()
+        _EXECUTOR.submit(_do_test)
 
     def _on_close(self, *_args):
         self.settings.update(
@@ -396,6 +669,10 @@ class PreferencesWindow(Adw.PreferencesWindow):
             }
         )
         save_settings(self.settings)
+        _set_logging_enabled(self.settings["enable_logging"])
+        parent = self.get_transient_for()
+        if isinstance(parent, MainWindow):
+            parent._reload_settings()
         return False
 
 # --- Main Window ---
@@ -407,19 +684,37 @@ class MainWindow(Adw.ApplicationWindow):
         super().__init__(application=app, title=_("DDTP Translate"), default_width=1200, default_height=750, **kwargs)
 
         self.packages = []
+        self._pkg_items = {}  # package name -> PackageItem
         self.current_pkg = None
         self.settings = load_settings()
+        _set_logging_enabled(self.settings.get("enable_logging", False))
         self._heatmap_mode = False
+        self._heatmap_stale = False
+        self._heatmap_pkgs = []  # packages the heatmap tiles were built for
         self._sort_ascending = True
         self._sort_mode = self.settings.get("sort_mode", "alpha")  # alpha, status, popcon
+        self._last_sort_signature = None
+        self._last_apply_fingerprint = None
+        self._status_version = 0  # bumped whenever _pkg_ddtss_status changes
+        self._pending_refresh_id = 0
+        self._pending_resort = False
         self._last_send_time = 0
         self._queue = []
+        # QueueItem status -> number of queue items; the batch thread
+        # updates it too, so changes go through _queue_counts_lock
+        self._queue_counts = collections.Counter()
+        self._queue_counts_lock = threading.Lock()
+        self._ready_queue_pkgs = None  # built on demand by _ready_queue_packages
+        self._queue_dirty = False
+        self._queue_save_source = None
+        self._queue_save_thread = None
         self._batch_running = False
         self._batch_cancel = False
-        self._submitted_packages = set()
-        self._modified_packages = set()
-        self._error_packages = set()
+        self._pkg_flags = {}  # package name -> PKG_* bits
         self._ddtss_logged_in = False
+        # Logged-in DDTSS clients by language, shared by the worker threads
+        self._ddtss_clients = {}
+        self._ddtss_clients_lock = threading.Lock()
         self._completion_pct = 0.0
 
         # DDTSS status tracking
@@ -443,11 +738,8 @@ class MainWindow(Adw.ApplicationWindow):
         outer_box.append(header)
 
         # Language dropdown
-        lang_store = Gtk.StringList()
-        self._lang_codes = []
-        for code, name in DDTP_LANGUAGES:
-            lang_store.append(f"{name} ({code})")
-            self._lang_codes.append(code)
+        lang_store = Gtk.StringList.new([f"{name} ({code})" for code, name in DDTP_LANGUAGES])
+        self._lang_codes = tuple(code for code, _name in DDTP_LANGUAGES)
 
         self.lang_dropdown = Gtk.DropDown(model=lang_store)
         default_lang = self.settings.get("default_language", "sv")
@@ -462,11 +754,9 @@ class MainWindow(Adw.ApplicationWindow):
         header.pack_start(refresh_btn)
 
         # Sort mode dropdown
-        sort_model = Gtk.StringList()
         self._sort_modes = ["alpha", "status", "popcon"]
         self._sort_mode_labels = [_("Alphabetical"), _("By status"), _("By popularity")]
-        for label in self._sort_mode_labels:
-            sort_model.append(label)
+        sort_model = Gtk.StringList.new(self._sort_mode_labels)
         self._sort_dropdown = Gtk.DropDown(model=sort_model)
         self._sort_dropdown.set_tooltip_text(_("Sort mode"))
         if self._sort_mode in self._sort_modes:
@@ -481,7 +771,6 @@ class MainWindow(Adw.ApplicationWindow):
         self._sort_btn = sort_btn
 
         # Status filter dropdown
-        filter_model = Gtk.StringList()
         self._filter_values = ["all", "none", "pending", "reviewed_comment", "reviewed_ok"]
         self._filter_labels = [
             _("All packages"),
@@ -490,8 +779,7 @@ class MainWindow(Adw.ApplicationWindow):
             _("🟠 Reviewed (with comments)"),
             _("🟢 Reviewed OK"),
         ]
-        for label in self._filter_labels:
-            filter_model.append(label)
+        filter_model = Gtk.StringList.new(self._filter_labels)
         self._filter_dropdown = Gtk.DropDown(model=filter_model)
         self._filter_dropdown.set_tooltip_text(_("Filter by status"))
         self._filter_dropdown.connect("notify::selected", self._on_filter_changed)
@@ -665,9 +953,21 @@ class MainWindow(Adw.ApplicationWindow):
         sidebar_box.append(self._progress_bar)
 
         scroll = Gtk.ScrolledWindow(vexpand=True)
-        self.pkg_list = Gtk.ListBox()
-        self.pkg_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.pkg_list.connect("row-selected", self._on_pkg_selected)
+        # Only the rows in view are realized; the factory rebinds them as
+        # the list scrolls
+        self._pkg_store = Gio.ListStore.new(PackageItem)
+        # The search runs inside GTK, matching the items' name property
+        self._pkg_filter = Gtk.StringFilter.new(Gtk.PropertyExpression.new(PackageItem, None, "name"))
+        self._pkg_filter.set_ignore_case(True)
+        self._pkg_filter.set_match_mode(Gtk.StringFilterMatchMode.SUBSTRING)
+        self._pkg_filter_model = Gtk.FilterListModel(model=self._pkg_store, filter=self._pkg_filter)
+        self._pkg_selection = Gtk.SingleSelection(
+            model=self._pkg_filter_model, autoselect=False, can_unselect=True)
+        self._pkg_selection.connect("notify::selected", self._on_pkg_selected)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_pkg_row_setup)
+        factory.connect("bind", self._on_pkg_row_bind)
+        self.pkg_list = Gtk.ListView(model=self._pkg_selection, factory=factory)
         scroll.set_child(self.pkg_list)
 
         hm_scroll = Gtk.ScrolledWindow(vexpand=True)
@@ -682,6 +982,11 @@ class MainWindow(Adw.ApplicationWindow):
         self._heatmap_flow.set_margin_end(6)
         self._heatmap_flow.set_margin_top(6)
         self._heatmap_flow.set_margin_bottom(6)
+        # One handler and cursor for all tiles instead of one per tile
+        self._heatmap_flow.set_activate_on_single_click(True)
+        self._heatmap_flow.connect(
+            "child-activated", lambda _flow, child: self._on_heatmap_tile_clicked(child.get_index()))
+        self._heatmap_flow.set_cursor(Gdk.Cursor.new_from_name("pointer"))
         hm_scroll.set_child(self._heatmap_flow)
 
         self._sidebar_stack = Gtk.Stack()
@@ -984,6 +1289,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         # Load persisted queue
         self._queue = _load_queue()
+        self._recount_queue()
 
         # Load initial data
         self._refresh_packages()
@@ -1018,18 +1324,14 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _update_status_bar(self):
         untranslated = len(self.packages)
-        queue_count = sum(1 for q in self._queue if q.status == QueueItem.STATUS_READY)
-        sent_count = sum(1 for q in self._queue if q.status == QueueItem.STATUS_SENT)
+        queue_count = self._queue_counts[QueueItem.STATUS_READY]
+        sent_count = self._queue_counts[QueueItem.STATUS_SENT]
         self._status_counts.set_text(
             _("{untranslated} untranslated | {queue} in queue | {sent} submitted").format(
                 untranslated=untranslated, queue=queue_count, sent=sent_count))
 
         lang = self._current_lang()
-        lang_name = lang
-        for code, name in DDTP_LANGUAGES:
-            if code == lang:
-                lang_name = name
-                break
+        lang_name = DDTP_LANGUAGE_NAMES.get(lang, lang)
         login_status = _("logged in") if self._ddtss_logged_in else _("not logged in")
         self._status_right.set_text(f"{lang_name} | {self._completion_pct:.1f}% | DDTSS: {login_status}")
 
@@ -1041,6 +1343,32 @@ class MainWindow(Adw.ApplicationWindow):
             return self._lang_codes[idx]
         return "sv"
 
+    def _get_ddtss_client(self, lang, settings):
+        """Return the shared DDTSS client for lang, logging in if needed.
+
+        Called from worker threads; the lock keeps concurrent callers
+        from logging in twice.
+        """
+        with self._ddtss_clients_lock:
+            client = self._ddtss_clients.get(lang)
+            if client is None:
+                client = self._ddtss_clients[lang] = DDTSSClient(lang=lang)
+            if not client.is_logged_in():
+                client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
+        return client
+
+    def _reload_settings(self):
+        """Re-read the settings after the preferences were saved."""
+        old_account = (self.settings.get("ddtss_alias"), self.settings.get("ddtss_password"))
+        self.settings = load_settings()
+        if old_account != (self.settings.get("ddtss_alias"), self.settings.get("ddtss_password")):
+            self._reset_ddtss_clients()
+
+    def _reset_ddtss_clients(self):
+        """Forget the shared DDTSS clients, e.g. after the account changed."""
+        with self._ddtss_clients_lock:
+            self._ddtss_clients.clear()
+
     def _format_duration(self, seconds):
         if seconds < 60:
             return _("{s} seconds").format(s=int(seconds))
@@ -1072,26 +1400,61 @@ class MainWindow(Adw.ApplicationWindow):
             self._status_filter = self._filter_values[idx]
             self._apply_sort_and_filter()
 
-    def _get_sort_key(self, pkg):
-        """Return sort key for a package based on current sort mode."""
-        name = pkg.get("package", "").lower()
+    def _get_sort_keys(self, pkgs):
+        """Return the sort key of every package for the current sort mode."""
+        names = [pkg.get("package", "") for pkg in pkgs]
         if self._sort_mode == "status":
-            status = self._pkg_ddtss_status.get(pkg.get("package", ""), "none")
-            order = {"none": 0, "pending": 1, "reviewed_comment": 2, "reviewed_ok": 3}
-            return (order.get(status, 0), name)
+            status = self._pkg_ddtss_status.get
+            rank = _STATUS_SORT_ORDER.get
+            return [(rank(status(name, "none"), 0), name.lower()) for name in names]
         elif self._sort_mode == "popcon":
-            count = self._popcon_data.get(pkg.get("package", ""), 0)
-            return (-count, name)  # Higher count first
-        return name
-
-    def _apply_sort_and_filter(self):
-        """Re-sort and re-filter the package list."""
+            popcon = self._popcon_data.get
+            return [(-popcon(name, 0), name.lower()) for name in names]  # Higher count first
+        return [name.lower() for name in names]
+
+    def _schedule_apply_sort_and_filter(self, resort=False):
+        """Run _apply_sort_and_filter soon, once for a burst of calls."""
+        self._pending_resort = self._pending_resort or resort
+        if not self._pending_refresh_id:
+            self._pending_refresh_id = GLib.timeout_add(REFRESH_COALESCE_MS, self._flush_refresh)
+
+    def _flush_refresh(self):
+        resort = self._pending_resort
+        self._pending_refresh_id = 0
+        self._pending_resort = False
+        self._apply_sort_and_filter(resort=resort)
+        return GLib.SOURCE_REMOVE
+
+    def _apply_sort_and_filter(self, resort=False):
+        """Re-filter the package list, re-sorting it if needed.
+
+        The list is only sorted again when the sort mode, direction or
+        package list changed since the last sort, or resort is set
+        because the data the current sort mode uses has changed. When
+        none of the inputs changed, the shown rows are only redrawn.
+        """
         pkgs = getattr(self, '_all_packages', self.packages)
         if not pkgs:
             return
 
+        # The status filter depends on the DDTSS statuses as well
+        fingerprint = (
+            id(pkgs), len(pkgs), self._sort_mode, self._sort_ascending,
+            self._status_filter, self._get_max_packages(),
+            self._status_version if self._status_filter != "all" else None,
+        )
+        if not resort and fingerprint == self._last_apply_fingerprint:
+            self._refresh_pkg_list_flags()
+            return
+        self._last_apply_fingerprint = fingerprint
+
         # Sort
-        pkgs.sort(key=self._get_sort_key, reverse=not self._sort_ascending)
+        signature = (self._sort_mode, self._sort_ascending, id(pkgs), len(pkgs))
+        if resort or signature != self._last_sort_signature:
+            keys = self._get_sort_keys(pkgs)
+            order = sorted(range(len(pkgs)), key=keys.__getitem__, reverse=not self._sort_ascending)
+            pkgs[:] = [pkgs[i] for i in order]
+            self._last_sort_signature = signature
 
         # Filter by status
         if self._status_filter != "all":
@@ -1125,6 +1488,10 @@ class MainWindow(Adw.ApplicationWindow):
         self._progress_bar.set_fraction(0.0)
         self._progress_bar.set_text(_("Downloading package data…"))
         self._progress_bar.set_show_text(True)
+        self._all_packages = []
+        self._pkg_items = {}
+        self._last_apply_fingerprint = None
+        self._last_sort_signature = None
         self._clear_list()
 
         self._loading = True
@@ -1139,6 +1506,11 @@ class MainWindow(Adw.ApplicationWindow):
 
         def do_fetch():
             try:
+                # Show the last list right away; the fetch below replaces it
+                if not force:
+                    cached = load_cached_untranslated(lang)
+                    if cached:
+                        GLib.idle_add(self._on_cached_packages_loaded, cached)
                 pkgs = fetch_untranslated(lang, force_refresh=force)
                 self._loading = False
                 GLib.idle_add(self._on_packages_loaded, pkgs)
@@ -1146,7 +1518,7 @@ class MainWindow(Adw.ApplicationWindow):
                 self._loading = False
                 GLib.idle_add(self._on_load_error, str(exc))
 
-        threading.Thread(target=do_fetch, daemon=True).start()
+        _EXECUTOR.submit(do_fetch)
 
         # Fetch stats for completion %
         def do_stats():
@@ -1163,7 +1535,12 @@ class MainWindow(Adw.ApplicationWindow):
             except Exception:
                 pass
 
-        threading.Thread(target=do_stats, daemon=True).start()
+        _EXECUTOR.submit(do_stats)
+
+        # DDTSS statuses and popcon counts do not depend on the package
+        # list, so fetch them alongside it instead of after it
+        self._fetch_ddtss_statuses()
+        self._fetch_popcon_data()
 
     def _get_max_packages(self):
         return self.settings.get("max_packages", 500)
@@ -1173,18 +1550,22 @@ class MainWindow(Adw.ApplicationWindow):
         self._progress_bar.set_fraction(1.0)
         self._progress_bar.set_text(_("{n} packages loaded").format(n=total))
         GLib.timeout_add(1500, self._hide_progress)
+        # A new list object, which the sort signature must not mistake
+        # for an earlier one that happened to get the same id()
         self._all_packages = pkgs
-        self._apply_sort_and_filter()
+        self._last_sort_signature = None
+        self._schedule_apply_sort_and_filter()
         self._update_status_bar()
 
-        # Fetch DDTSS statuses in background
-        self._fetch_ddtss_statuses()
-        # Fetch popcon data in background
-        self._fetch_popcon_data()
+    def _on_cached_packages_loaded(self, pkgs):
+        if self._loading:
+            self._all_packages = pkgs
+            self._last_sort_signature = None
+            self._schedule_apply_sort_and_filter()
 
     def _on_load_error(self, msg):
         self._progress_bar.set_visible(False)
-        if "urlopen" in msg or "Connection refused" in msg or "timed out" in msg or "unreachable" in msg.lower():
+        if _NETWORK_ERR_RE.search(msg):
             friendly = _("Could not connect to DDTP servers. Check your internet connection and try again.")
         else:
             friendly = _("Failed to load packages: {error}").format(error=msg)
@@ -1196,7 +1577,7 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _fetch_ddtss_statuses(self):
         """Fetch DDTSS package statuses in background."""
-        settings = load_settings()
+        settings = self.settings
         if not settings.get("fetch_ddtss_statuses", True):
             return
         if not settings.get("ddtss_alias"):
@@ -1206,9 +1587,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         def do_fetch():
             try:
-                client = DDTSSClient(lang=lang)
-                if not client.is_logged_in():
-                    client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
+                client = self._get_ddtss_client(lang, settings)
                 self._ddtss_logged_in = True
                 statuses = client.get_package_statuses()
 
@@ -1237,11 +1616,12 @@ class MainWindow(Adw.ApplicationWindow):
                 GLib.idle_add(self.status_label.set_text,
                               _("DDTSS status fetch failed: {e}").format(e=str(exc)))
 
-        threading.Thread(target=do_fetch, daemon=True).start()
+        _EXECUTOR.submit(do_fetch)
 
     def _on_ddtss_statuses_loaded(self, status_map):
         self._pkg_ddtss_status.update(status_map)
-        self._apply_sort_and_filter()
+        self._status_version += 1
+        self._schedule_apply_sort_and_filter(resort=self._sort_mode == "status")
         self._update_status_bar()
 
     def _fetch_popcon_data(self):
@@ -1253,17 +1633,16 @@ class MainWindow(Adw.ApplicationWindow):
             except Exception:
                 pass
 
-        threading.Thread(target=do_fetch, daemon=True).start()
+        _EXECUTOR.submit(do_fetch)
 
     def _on_popcon_loaded(self, data):
         self._popcon_data = data
-        # Re-sort if currently sorting by popcon
-        if self._sort_mode == "popcon":
-            self._apply_sort_and_filter()
+        # Re-sort if currently sorting by popcon; rows show the counts either way
+        self._schedule_apply_sort_and_filter(resort=self._sort_mode == "popcon")
 
     def _fetch_pkg_ddtss_data(self, package):
         """Fetch translation data for a specific package from DDTSS."""
-        settings = load_settings()
+        settings = self.settings
         if not settings.get("ddtss_alias"):
             return
 
@@ -1271,9 +1650,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         def do_fetch():
             try:
-                client = DDTSSClient(lang=lang)
-                if not client.is_logged_in():
-                    client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
+                client = self._get_ddtss_client(lang, settings)
                 status = self._pkg_ddtss_status.get(package, "none")
                 if status in ("pending", "reviewed_comment", "reviewed_ok"):
                     data = client.get_review_page(package)
@@ -1283,7 +1660,7 @@ class MainWindow(Adw.ApplicationWindow):
             except Exception:
                 pass
 
-        threading.Thread(target=do_fetch, daemon=True).start()
+        _EXECUTOR.submit(do_fetch)
 
     def _on_pkg_ddtss_data_loaded(self, package, data):
         self._pkg_ddtss_data[package] = data
@@ -1298,224 +1675,276 @@ class MainWindow(Adw.ApplicationWindow):
                 buf.set_text(trans_text)
 
     def _clear_list(self):
-        if hasattr(self.pkg_list, "remove_all"):
-            self.pkg_list.remove_all()
-        else:
-            while True:
-                row = self.pkg_list.get_row_at_index(0)
-                if row is None:
-                    break
-                self.pkg_list.remove(row)
+        self._pkg_store.remove_all()
 
     def _on_heatmap_toggled(self, btn):
         self._heatmap_mode = btn.get_active()
         self._sidebar_stack.set_visible_child_name("heatmap" if self._heatmap_mode else "list")
+        if self._heatmap_mode and self._heatmap_stale:
+            self._rebuild_heatmap()
+
+    def _set_pkg_flag(self, pkg_name, flag):
+        self._pkg_flags[pkg_name] = self._pkg_flags.get(pkg_name, 0) | flag
+
+    def _clear_pkg_flag(self, pkg_name, flag):
+        flags = self._pkg_flags.get(pkg_name, 0) & ~flag
+        if flags:
+            self._pkg_flags[pkg_name] = flags
+        else:
+            self._pkg_flags.pop(pkg_name, None)
 
     def _get_status_icon(self, pkg_name):
-        """Return a Gtk.Image status icon for a package, or None."""
+        """Return (icon name, CSS class, tooltip) for a package's status icon."""
         # Local session status takes priority
-        if pkg_name in self._submitted_packages:
-            icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-            icon.set_tooltip_text(_("Submitted ✅"))
-            icon.add_css_class("pkg-flag-submitted")
-            return icon
-        if pkg_name in self._error_packages:
-            icon = Gtk.Image.new_from_icon_name("dialog-error-symbolic")
-            icon.set_tooltip_text(_("Submission error ⚠️"))
-            icon.add_css_class("pkg-flag-error")
-            return icon
-        if any(q.package == pkg_name and q.status == QueueItem.STATUS_READY for q in self._queue):
-            icon = Gtk.Image.new_from_icon_name("mail-unread-symbolic")
-            icon.set_tooltip_text(_("In queue 📬"))
-            icon.add_css_class("pkg-flag-queued")
-            return icon
-        if pkg_name in self._modified_packages:
-            icon = Gtk.Image.new_from_icon_name("document-edit-symbolic")
-            icon.set_tooltip_text(_("Modified — not in queue 📝"))
-            icon.add_css_class("pkg-flag-modified")
-            return icon
+        flags = self._pkg_flags.get(pkg_name, 0)
+        if flags & PKG_SUBMITTED:
+            return ("emblem-ok-symbolic", "pkg-flag-submitted", _("Submitted ✅"))
+        if flags & PKG_ERROR:
+            return ("dialog-error-symbolic", "pkg-flag-error", _("Submission error ⚠️"))
+        if pkg_name in self._ready_queue_packages():
+            return ("mail-unread-symbolic", "pkg-flag-queued", _("In queue 📬"))
+        if flags & PKG_MODIFIED:
+            return ("document-edit-symbolic", "pkg-flag-modified", _("Modified — not in queue 📝"))
 
         # DDTSS status icons
         ddtss_status = self._pkg_ddtss_status.get(pkg_name)
         if ddtss_status == "reviewed_ok":
-            icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-            icon.set_tooltip_text(_("Reviewed OK ✅"))
-            icon.add_css_class("pkg-status-reviewed-ok")
-            return icon
+            return ("emblem-ok-symbolic", "pkg-status-reviewed-ok", _("Reviewed OK ✅"))
         if ddtss_status == "reviewed_comment":
-            icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-            icon.set_tooltip_text(_("Reviewed (with comments) 🟠"))
-            icon.add_css_class("pkg-status-reviewed-comment")
-            return icon
+            return ("emblem-ok-symbolic", "pkg-status-reviewed-comment", _("Reviewed (with comments) 🟠"))
         if ddtss_status == "pending":
-            icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-            icon.set_tooltip_text(_("Submitted, not reviewed 🟡"))
-            icon.add_css_class("pkg-status-pending")
-            return icon
+            return ("emblem-ok-symbolic", "pkg-status-pending", _("Submitted, not reviewed 🟡"))
 
         # No translation (default blue)
-        icon = Gtk.Image.new_from_icon_name("list-add-symbolic")
-        icon.set_tooltip_text(_("Not translated 🔵"))
-        icon.add_css_class("pkg-status-none")
-        return icon
+        return ("list-add-symbolic", "pkg-status-none", _("Not translated 🔵"))
 
     def _populate_list(self, pkgs, update_stats=True):
         self.packages = pkgs
-        self._clear_list()
+        # Reuse the list items across sorts and filters; the selection
+        # follows an item that is still in the list after the splice
+        items = []
         for pkg in pkgs:
-            row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-            row_box.add_css_class("compact-row")
-            row_box.set_margin_start(6)
-            row_box.set_margin_end(6)
-            row_box.set_margin_top(2)
-            row_box.set_margin_bottom(2)
-
-            label = Gtk.Label(label=pkg["package"], xalign=0, hexpand=True)
-            label.set_ellipsize(Pango.EllipsizeMode.END)
-            row_box.append(label)
-
-            # Popcon count label
-            popcon_count = self._popcon_data.get(pkg["package"], 0)
-            if popcon_count > 0:
-                pop_label = Gtk.Label(label=str(popcon_count))
-                pop_label.add_css_class("dim-label")
-                pop_label.set_tooltip_text(_("Popcon installs: {n}").format(n=popcon_count))
-                row_box.append(pop_label)
-
-            icon = self._get_status_icon(pkg["package"])
-            row_box.append(icon)
-
-            self.pkg_list.append(row_box)
+            item = self._pkg_items.get(pkg["package"])
+            if item is None or item.pkg is not pkg:
+                item = self._pkg_items[pkg["package"]] = PackageItem(pkg)
+            items.append(item)
+        self._pkg_store.splice(0, self._pkg_store.get_n_items(), items)
+        self._restore_pkg_selection()
         if update_stats:
             self.stats_label.set_text(_("{n} untranslated").format(n=len(pkgs)))
         self.status_label.set_text(_("Ready"))
         self._update_status_bar()
 
-        # Rebuild heatmap
+        # The heatmap is only rebuilt while it is shown, and only when the
+        # packages or their order changed; the tiles do not show status
+        shown = self._heatmap_pkgs
+        if len(pkgs) != len(shown) or any(a is not b for a, b in zip(pkgs, shown)):
+            self._heatmap_stale = True
+        if self._heatmap_mode and self._heatmap_stale:
+            self._rebuild_heatmap()
+
+    def _rebuild_heatmap(self):
+        """Recreate the heatmap tiles for self.packages."""
+        self._heatmap_stale = False
+        self._heatmap_pkgs = list(self.packages)
+        flow = self._heatmap_flow
+        # A hidden FlowBox is not relaid out for each removed/added tile
+        flow.set_visible(False)
         while True:
-            child = self._heatmap_flow.get_first_child()
+            child = flow.get_first_child()
             if child is None:
                 break
-            self._heatmap_flow.remove(child)
-        for i, pkg in enumerate(pkgs):
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=1)
-            box.set_size_request(100, 44)
-            box.add_css_class("heatmap-red")
-            box.set_margin_start(2)
-            box.set_margin_end(2)
-            box.set_margin_top(2)
-            box.set_margin_bottom(2)
-            lbl = Gtk.Label(label=pkg["package"])
-            lbl.set_ellipsize(Pango.EllipsizeMode.END)
-            lbl.set_max_width_chars(14)
-            lbl.set_margin_top(4)
-            lbl.set_margin_start(4)
-            lbl.set_margin_end(4)
-            lbl.set_margin_bottom(4)
-            box.append(lbl)
-            box.set_tooltip_text(pkg["package"])
-            gesture = Gtk.GestureClick()
-            gesture.connect("released", lambda g, n, x, y, idx=i: self._select_pkg_by_index(idx))
-            box.add_controller(gesture)
-            box.set_cursor(Gdk.Cursor.new_from_name("pointer"))
-            self._heatmap_flow.append(box)
+            flow.remove(child)
+        for pkg in self.packages:
+            flow.append(self._build_heatmap_tile(pkg["package"]))
+        flow.set_visible(True)
+
+    def _build_heatmap_tile(self, name):
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=1)
+        box.set_size_request(100, 44)
+        box.add_css_class("heatmap-red")
+        box.set_margin_start(2)
+        box.set_margin_end(2)
+        box.set_margin_top(2)
+        box.set_margin_bottom(2)
+        lbl = Gtk.Label(label=name)
+        lbl.set_ellipsize(Pango.EllipsizeMode.END)
+        lbl.set_max_width_chars(14)
+        lbl.set_margin_top(4)
+        lbl.set_margin_start(4)
+        lbl.set_margin_end(4)
+        lbl.set_margin_bottom(4)
+        box.append(lbl)
+        box.set_tooltip_text(name)
+        return box
 
     def _on_trans_buffer_changed(self, buf):
         if self.current_pkg:
             pkg_name = self.current_pkg["package"]
-            if pkg_name not in self._submitted_packages:
-                self._modified_packages.add(pkg_name)
+            flags = self._pkg_flags.get(pkg_name, 0)
+            if not flags & PKG_SUBMITTED:
+                self._pkg_flags[pkg_name] = flags | PKG_MODIFIED
+
+    def _on_pkg_row_setup(self, _factory, list_item):
+        row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+        row_box.add_css_class("compact-row")
+        row_box.set_margin_start(6)
+        row_box.set_margin_end(6)
+        row_box.set_margin_top(2)
+        row_box.set_margin_bottom(2)
+
+        label = Gtk.Label(xalign=0, hexpand=True)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        row_box.append(label)
+
+        # Popcon count label
+        pop_label = Gtk.Label()
+        pop_label.add_css_class("dim-label")
+        row_box.append(pop_label)
+
+        row_box.append(Gtk.Image())
+        list_item.set_child(row_box)
+
+    def _on_pkg_row_bind(self, _factory, list_item):
+        row_box = list_item.get_child()
+        name = list_item.get_item().name
+        label = row_box.get_first_child()
+        label.set_text(name)
+
+        pop_label = label.get_next_sibling()
+        popcon_count = self._popcon_data.get(name, 0)
+        pop_label.set_visible(popcon_count > 0)
+        if popcon_count > 0:
+            pop_label.set_text(str(popcon_count))
+            pop_label.set_tooltip_text(_("Popcon installs: {n}").format(n=popcon_count))
+
+        icon_name, css_class, tooltip = self._get_status_icon(name)
+        icon = pop_label.get_next_sibling()
+        icon.set_from_icon_name(icon_name)
+        icon.set_css_classes([css_class])
+        icon.set_tooltip_text(tooltip)
 
     def _refresh_pkg_list_flags(self):
-        if self.packages:
-            self._populate_list(self.packages, update_stats=False)
+        # Rebind the realized rows so their status icons are redrawn
+        n_items = self._pkg_store.get_n_items()
+        if n_items:
+            self._pkg_store.items_changed(0, n_items, n_items)
 
     def _select_pkg_by_index(self, idx):
-        row = self.pkg_list.get_row_at_index(idx)
-        if row:
-            self.pkg_list.select_row(row)
-            self._on_pkg_selected(self.pkg_list, row)
+        """Select the package at position idx of the (filtered) sidebar list."""
+        if 0 <= idx < self._pkg_selection.get_n_items():
+            self._pkg_selection.set_selected(idx)
+
+    def _on_heatmap_tile_clicked(self, idx):
+        pkg = self.packages[idx]
+        for pos in range(self._pkg_selection.get_n_items()):
+            if self._pkg_selection.get_item(pos).pkg is pkg:
+                self._pkg_selection.set_selected(pos)
+                return
+        # Hidden by the search filter; open it without a sidebar selection.
+        # It is reselected once the search shows it again.
+        self._pkg_selection.set_selected(Gtk.INVALID_LIST_POSITION)
+        self._show_package(pkg)
 
     def _on_search_changed(self, entry):
-        query = entry.get_text().lower()
-        idx = 0
-        while True:
-            row = self.pkg_list.get_row_at_index(idx)
-            if row is None:
-                break
-            child = row.get_child()
-            first_child = child.get_first_child() if child else None
-            text = first_child.get_text().lower() if first_child and hasattr(first_child, 'get_text') else ""
-            row.set_visible(query in text)
-            idx += 1
+        self._pkg_filter.set_search(entry.get_text())
+        self._restore_pkg_selection()
+
+    def _current_pkg_item(self):
+        """Return the PackageItem of current_pkg, or None if it is not listed."""
+        if self.current_pkg is None:
+            return None
+        item = self._pkg_items.get(self.current_pkg["package"])
+        if item is None or item.pkg is not self.current_pkg:
+            return None
+        found, _pos = self._pkg_store.find(item)
+        return item if found else None
+
+    def _restore_pkg_selection(self):
+        """Reselect current_pkg once the search shows it again."""
+        if self._pkg_selection.get_selected_item() is not None:
+            return
+        item = self._current_pkg_item()
+        if item is None or not self._pkg_filter.match(item):
+            return
+        for pos in range(self._pkg_selection.get_n_items()):
+            if self._pkg_selection.get_item(pos) is item:
+                self._pkg_selection.set_selected(pos)
+                return
 
-    def _on_pkg_selected(self, _listbox, row):
-        if row is None:
+    def _on_pkg_selected(self, selection, _pspec):
+        item = selection.get_selected_item()
+        if item is None:
+            # The search hid the package being edited; keep the editor
+            # and reselect it when it matches again
+            hidden = self._current_pkg_item()
+            if hidden is not None and not self._pkg_filter.match(hidden):
+                return
             self.current_pkg = None
             self.submit_btn.set_sensitive(False)
             self._add_queue_btn.set_sensitive(False)
             self._auto_translate_btn.set_sensitive(False)
             self._pkg_banner.set_visible(False)
             return
+        # The position also changes when the filter or list is updated
+        if item.pkg is not self.current_pkg:
+            self._show_package(item.pkg)
 
-        idx = row.get_index()
-        if 0 <= idx < len(self.packages):
-            pkg = self.packages[idx]
-            self.current_pkg = pkg
-            desc = pkg["short"]
-            if pkg["long"]:
-                desc += "\n\n" + pkg["long"]
-            self.orig_view.get_buffer().set_text(desc)
-
-            # If we have DDTSS data for this package, show the existing translation
-            ddtss_data = self._pkg_ddtss_data.get(pkg["package"])
-            if ddtss_data:
-                trans_text = ddtss_data.get("short_trans", "")
-                if ddtss_data.get("long_trans"):
-                    trans_text += "\n\n" + ddtss_data["long_trans"]
-                self.trans_view.get_buffer().set_text(trans_text)
-            else:
-                self.trans_view.get_buffer().set_text("")
-
-            self.submit_btn.set_sensitive(True)
-            self._add_queue_btn.set_sensitive(True)
-            self._auto_translate_btn.set_sensitive(True)
-
-            # Banner with status info
-            ddtss_status = self._pkg_ddtss_status.get(pkg["package"], "none")
-            status_labels = {
-                "none": "",
-                "pending": " — " + _("submitted, awaiting review"),
-                "reviewed_comment": " — " + _("reviewed with comments"),
-                "reviewed_ok": " — " + _("reviewed OK"),
-            }
-            popcon = self._popcon_data.get(pkg["package"], 0)
-            banner = pkg["package"]
-            if popcon:
-                banner += f"  (popcon: {popcon})"
-            banner += status_labels.get(ddtss_status, "")
-            self._pkg_banner.set_text(banner)
-            self._pkg_banner.set_visible(True)
-            self.status_label.set_text(_("Editing: {pkg}").format(pkg=pkg["package"]))
-
-            # If package has DDTSS status but we don't have the translation data yet, fetch it
-            if ddtss_status in ("pending", "reviewed_comment", "reviewed_ok") and not ddtss_data:
-                self._fetch_pkg_ddtss_data(pkg["package"])
+    def _show_package(self, pkg):
+        self.current_pkg = pkg
+        desc = pkg["short"]
+        if pkg["long"]:
+            desc += "\n\n" + pkg["long"]
+        self.orig_view.get_buffer().set_text(desc)
+
+        # If we have DDTSS data for this package, show the existing translation
+        ddtss_data = self._pkg_ddtss_data.get(pkg["package"])
+        if ddtss_data:
+            trans_text = ddtss_data.get("short_trans", "")
+            if ddtss_data.get("long_trans"):
+                trans_text += "\n\n" + ddtss_data["long_trans"]
+            self.trans_view.get_buffer().set_text(trans_text)
+        else:
+            self.trans_view.get_buffer().set_text("")
+
+        self.submit_btn.set_sensitive(True)
+        self._add_queue_btn.set_sensitive(True)
+        self._auto_translate_btn.set_sensitive(True)
+
+        # Banner with status info
+        ddtss_status = self._pkg_ddtss_status.get(pkg["package"], "none")
+        status_labels = {
+            "none": "",
+            "pending": " — " + _("submitted, awaiting review"),
+            "reviewed_comment": " — " + _("reviewed with comments"),
+            "reviewed_ok": " — " + _("reviewed OK"),
+        }
+        popcon = self._popcon_data.get(pkg["package"], 0)
+        banner = pkg["package"]
+        if popcon:
+            banner += f"  (popcon: {popcon})"
+        banner += status_labels.get(ddtss_status, "")
+        self._pkg_banner.set_text(banner)
+        self._pkg_banner.set_visible(True)
+        self.status_label.set_text(_("Editing: {pkg}").format(pkg=pkg["package"]))
+
+        # If package has DDTSS status but we don't have the translation data yet, fetch it
+        if ddtss_status in ("pending", "reviewed_comment", "reviewed_ok") and not ddtss_data:
+            self._fetch_pkg_ddtss_data(pkg["package"])
 
     def _advance_to_next_package(self):
         if not self.packages:
             return
-        row = self.pkg_list.get_selected_row()
-        next_idx = (row.get_index() + 1) if row else 0
-        if next_idx < len(self.packages):
-            self._select_pkg_by_index(next_idx)
+        pos = self._pkg_selection.get_selected()
+        next_idx = 0 if pos == Gtk.INVALID_LIST_POSITION else pos + 1
+        self._select_pkg_by_index(next_idx)
 
     def _go_to_prev_package(self):
         if not self.packages:
             return
-        row = self.pkg_list.get_selected_row()
-        if row and row.get_index() > 0:
-            self._select_pkg_by_index(row.get_index() - 1)
+        pos = self._pkg_selection.get_selected()
+        if pos != Gtk.INVALID_LIST_POSITION and pos > 0:
+            self._select_pkg_by_index(pos - 1)
 
     # --- Single submit ---
 
@@ -1529,7 +1958,7 @@ class MainWindow(Adw.ApplicationWindow):
             self.status_label.set_text(_("Translation is empty"))
             return
 
-        settings = load_settings()
+        settings = self.settings
         if not settings.get("ddtss_alias"):
             self._show_login_dialog()
             return
@@ -1545,39 +1974,35 @@ class MainWindow(Adw.ApplicationWindow):
 
         def do_send():
             try:
-                client = DDTSSClient(lang=lang)
-                if not client.is_logged_in():
-                    client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
+                client = self._get_ddtss_client(lang, settings)
                 client.submit_translation(pkg["package"], short, long_text)
                 self._ddtss_logged_in = True
                 self._last_send_time = time.time()
-                self._submitted_packages.add(pkg["package"])
-                self._modified_packages.discard(pkg["package"])
-                self._error_packages.discard(pkg["package"])
+                self._pkg_flags[pkg["package"]] = PKG_SUBMITTED
                 GLib.idle_add(self._refresh_pkg_list_flags)
                 GLib.idle_add(self._update_status_bar)
                 GLib.idle_add(self._show_submit_result, pkg["package"], True, "")
                 if settings.get("auto_advance", True):
                     GLib.idle_add(self._advance_to_next_package)
             except DDTSSAuthError as exc:
-                self._error_packages.add(pkg["package"])
+                self._set_pkg_flag(pkg["package"], PKG_ERROR)
                 GLib.idle_add(self._show_submit_result, pkg["package"], False,
                     _("Login failed: {e}").format(e=str(exc)))
             except DDTSSValidationError as exc:
-                self._error_packages.add(pkg["package"])
+                self._set_pkg_flag(pkg["package"], PKG_ERROR)
                 GLib.idle_add(self._show_submit_result, pkg["package"], False,
                     _("Validation error: {e}").format(e=str(exc)))
             except DDTSSLockedError as exc:
-                self._error_packages.add(pkg["package"])
+                self._set_pkg_flag(pkg["package"], PKG_ERROR)
                 GLib.idle_add(self._show_submit_result, pkg["package"], False,
                     _("Package locked: {e}").format(e=str(exc)))
             except Exception as exc:
-                self._error_packages.add(pkg["package"])
+                self._set_pkg_flag(pkg["package"], PKG_ERROR)
                 GLib.idle_add(self._show_submit_result, pkg["package"], False,
                     _("Error: {e}").format(e=str(exc)))
             GLib.idle_add(self.submit_btn.set_sensitive, True)
 
-        threading.Thread(target=do_send, daemon=True).start()
+        _EXECUTOR.submit(do_send)
 
     def _on_copy_source(self, *_args):
         """Copy original text to clipboard."""
@@ -1607,7 +2032,7 @@ class MainWindow(Adw.ApplicationWindow):
         if not self.current_pkg:
             return
 
-        if not shutil.which("po-translate"):
+        if not _find_tool("po-translate"):
             dialog = Adw.AlertDialog(
                 heading=_("po-translate not found"),
                 body=_("po-translate is not installed. Install it with:\n\n"
@@ -1656,17 +2081,13 @@ class MainWindow(Adw.ApplicationWindow):
                 short = lines[0]
                 long_parts = lines[1:] if len(lines) > 1 else []
 
+                buf = io.StringIO()
+                _write_po_entry(buf, "", f"Content-Type: text/plain; charset=UTF-8\nLanguage: {lang}\n")
+                _write_po_entry(buf, short)
+                if long_parts:
+                    _write_po_entry(buf, "\n".join(long_parts) + "\n")
                 with open(po_path, "w", encoding="utf-8") as f:
-                    f.write('msgid ""\nmsgstr ""\n')
-                    f.write(f'"Content-Type: text/plain; charset=UTF-8\\n"\n')
-                    f.write(f'"Language: {lang}\\n"\n\n')
-                    f.write(f'msgid "{_po_escape(short)}"\nmsgstr ""\n\n')
-                    if long_parts:
-                        long_text = "\n".join(long_parts)
-                        f.write('msgid ""\n')
-                        for lp in long_text.split("\n"):
-                            f.write(f'"{_po_escape(lp)}\\n"\n')
-                        f.write('msgstr ""\n')
+                    f.write(buf.getvalue())
 
                 result = subprocess.run(
                     ["po-translate", "--source", "en", "--target", lang, "-q", po_path],
@@ -1698,7 +2119,7 @@ class MainWindow(Adw.ApplicationWindow):
             except Exception as exc:
                 GLib.idle_add(self._auto_translate_done, None, str(exc))
 
-        threading.Thread(target=do_translate, daemon=True).start()
+        _EXECUTOR.submit(do_translate)
 
     def _auto_translate_done(self, translation, error):
         self._auto_translate_btn.set_sensitive(True)
@@ -1753,10 +2174,10 @@ class MainWindow(Adw.ApplicationWindow):
             if item.package == pkg["package"] and item.md5 == pkg["md5"]:
                 item.short = short
                 item.long_text = long_text
-                item.status = QueueItem.STATUS_READY
+                self._set_queue_status(item, QueueItem.STATUS_READY)
                 item.error_msg = ""
-                _save_queue(self._queue)
-                self._modified_packages.discard(pkg["package"])
+                self._schedule_queue_save()
+                self._clear_pkg_flag(pkg["package"], PKG_MODIFIED)
                 self._update_queue_badge()
                 self._refresh_pkg_list_flags()
                 self._update_status_bar()
@@ -1764,9 +2185,9 @@ class MainWindow(Adw.ApplicationWindow):
                 _log_event(f"Updated {pkg['package']} in queue")
                 return
 
-        self._queue.append(QueueItem(pkg["package"], pkg["md5"], short, long_text))
-        _save_queue(self._queue)
-        self._modified_packages.discard(pkg["package"])
+        self._queue_append(QueueItem(pkg["package"], pkg["md5"], short, long_text))
+        self._schedule_queue_save()
+        self._clear_pkg_flag(pkg["package"], PKG_MODIFIED)
         self._update_queue_badge()
         self._refresh_pkg_list_flags()
         self._update_status_bar()
@@ -1774,31 +2195,94 @@ class MainWindow(Adw.ApplicationWindow):
             pkg=pkg["package"], n=len(self._queue)))
         _log_event(f"Added {pkg['package']} to queue")
 
-        settings = load_settings()
+        settings = self.settings
         if settings.get("auto_advance", True):
             self._advance_to_next_package()
 
     def _clear_sent(self, *_args):
         self._queue = [q for q in self._queue if q.status != QueueItem.STATUS_SENT]
-        _save_queue(self._queue)
+        self._recount_queue()
+        self._schedule_queue_save()
         self._update_queue_badge()
         self._update_status_bar()
 
     def _on_sort_queue(self, *_args):
         self._queue.sort(key=lambda q: q.package.lower())
-        _save_queue(self._queue)
+        self._schedule_queue_save()
         self._update_queue_badge()
 
     def _clear_queue(self):
         self._queue = [q for q in self._queue if q.status == QueueItem.STATUS_SENDING]
-        _save_queue(self._queue)
+        self._recount_queue()
+        self._schedule_queue_save()
         self._update_queue_badge()
         self._update_status_bar()
 
+    def _recount_queue(self):
+        """Recompute _queue_counts after the queue list was replaced."""
+        with self._queue_counts_lock:
+            self._queue_counts = collections.Counter(q.status for q in self._queue)
+            self._ready_queue_pkgs = None
+
+    def _queue_append(self, item):
+        with self._queue_counts_lock:
+            self._queue.append(item)
+            self._queue_counts[item.status] += 1
+            self._ready_queue_pkgs = None
+
+    def _set_queue_status(self, item, status):
+        """Change a queue item's status, keeping _queue_counts in step."""
+        with self._queue_counts_lock:
+            self._queue_counts[item.status] -= 1
+            item.status = status
+            self._queue_counts[status] += 1
+            self._ready_queue_pkgs = None
+
+    def _ready_queue_packages(self):
+        """Return the set of package names with a ready queue item."""
+        with self._queue_counts_lock:
+            if self._ready_queue_pkgs is None:
+                self._ready_queue_pkgs = frozenset(
+                    q.package for q in self._queue if q.status == QueueItem.STATUS_READY)
+            return self._ready_queue_pkgs
+
+    def _schedule_queue_save(self):
+        """Save the queue shortly; a burst of changes is written once."""
+        self._queue_dirty = True
+        if self._queue_save_source is None:
+            self._queue_save_source = GLib.timeout_add(
+                QUEUE_SAVE_DELAY_MS, self._on_queue_save_timeout)
+
+    def _on_queue_save_timeout(self):
+        self._queue_save_source = None
+        self._flush_queue_save(background=True)
+        return False
+
+    def _flush_queue_save(self, background=False):
+        """Write pending queue changes, on a worker thread if background is set."""
+        if self._queue_save_source is not None:
+            GLib.source_remove(self._queue_save_source)
+            self._queue_save_source = None
+        # Writes must land in order, and a foreground flush (e.g. on
+        # close) must not return while a background write is unfinished
+        if self._queue_save_thread is not None:
+            self._queue_save_thread.join()
+            self._queue_save_thread = None
+        if not self._queue_dirty:
+            return
+        self._queue_dirty = False
+        snapshot = list(self._queue)
+        if background:
+            self._queue_save_thread = threading.Thread(
+                target=_save_queue, args=(snapshot,), daemon=True)
+            self._queue_save_thread.start()
+        else:
+            _save_queue(snapshot)
+
     def _update_queue_badge(self):
-        ready_count = sum(1 for q in self._queue if q.status == QueueItem.STATUS_READY)
-        error_count = sum(1 for q in self._queue if q.status == QueueItem.STATUS_ERROR)
-        sent_count = sum(1 for q in self._queue if q.status == QueueItem.STATUS_SENT)
+        ready_count = self._queue_counts[QueueItem.STATUS_READY]
+        error_count = self._queue_counts[QueueItem.STATUS_ERROR]
+        sent_count = self._queue_counts[QueueItem.STATUS_SENT]
         total = ready_count + error_count + sent_count
         if total > 0:
             parts = []
@@ -1815,8 +2299,11 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _remove_queue_item(self, idx):
         if 0 <= idx < len(self._queue):
-            removed = self._queue.pop(idx)
-            _save_queue(self._queue)
+            with self._queue_counts_lock:
+                removed = self._queue.pop(idx)
+                self._queue_counts[removed.status] -= 1
+                self._ready_queue_pkgs = None
+            self._schedule_queue_save()
             self._update_queue_badge()
             self._update_status_bar()
             self.status_label.set_text(_("Removed {pkg} from queue").format(pkg=removed.package))
@@ -1841,16 +2328,19 @@ class MainWindow(Adw.ApplicationWindow):
         header.pack_start(sort_btn)
 
         scroll = Gtk.ScrolledWindow(vexpand=True)
-        queue_list = Gtk.ListBox()
-        queue_list.set_selection_mode(Gtk.SelectionMode.NONE)
+        # Fill the store before a view is attached to it
+        queue_store = Gio.ListStore.new(QueueItemObject)
+        self._populate_queue_list(queue_store)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_queue_row_setup, dialog)
+        factory.connect("bind", self._on_queue_row_bind)
+        queue_list = Gtk.ListView(model=Gtk.NoSelection.new(queue_store), factory=factory)
         scroll.set_child(queue_list)
         main_box.append(scroll)
 
-        self._populate_queue_list(queue_list, dialog)
-
-        ready_count = sum(1 for q in self._queue if q.status == QueueItem.STATUS_READY)
-        error_count = sum(1 for q in self._queue if q.status == QueueItem.STATUS_ERROR)
-        sent_count = sum(1 for q in self._queue if q.status == QueueItem.STATUS_SENT)
+        ready_count = self._queue_counts[QueueItem.STATUS_READY]
+        error_count = self._queue_counts[QueueItem.STATUS_ERROR]
+        sent_count = self._queue_counts[QueueItem.STATUS_SENT]
 
         parts = []
         if ready_count:
@@ -1897,47 +2387,61 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_content(main_box)
         dialog.present()
 
-    def _populate_queue_list(self, queue_list, dialog):
-        for i, item in enumerate(self._queue):
-            row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-            row_box.set_margin_start(8)
-            row_box.set_margin_end(8)
-            row_box.set_margin_top(4)
-            row_box.set_margin_bottom(4)
-
-            if item.status == QueueItem.STATUS_READY:
-                icon = Gtk.Image.new_from_icon_name("mail-unread-symbolic")
-                row_box.add_css_class("queue-ready")
-            elif item.status == QueueItem.STATUS_SENDING:
-                icon = Gtk.Image.new_from_icon_name("emblem-synchronizing-symbolic")
-            elif item.status == QueueItem.STATUS_SENT:
-                icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-                row_box.add_css_class("queue-sent")
-            else:
-                icon = Gtk.Image.new_from_icon_name("dialog-error-symbolic")
-                row_box.add_css_class("queue-error")
-            row_box.append(icon)
-
-            name_label = Gtk.Label(label=item.package, xalign=0, hexpand=True)
-            name_label.set_ellipsize(Pango.EllipsizeMode.END)
-            if item.error_msg:
-                name_label.set_tooltip_text(item.error_msg)
-            row_box.append(name_label)
+    def _populate_queue_list(self, queue_store):
+        queue_store.splice(0, queue_store.get_n_items(),
+                           [QueueItemObject(item) for item in self._queue])
+
+    def _on_queue_row_setup(self, _factory, list_item, dialog):
+        row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        row_box.set_margin_start(8)
+        row_box.set_margin_end(8)
+        row_box.set_margin_top(4)
+        row_box.set_margin_bottom(4)
+
+        row_box.append(Gtk.Image())
+
+        name_label = Gtk.Label(xalign=0, hexpand=True)
+        name_label.set_ellipsize(Pango.EllipsizeMode.END)
+        row_box.append(name_label)
+
+        err_label = Gtk.Label(label=_("Error"))
+        err_label.add_css_class("error")
+        row_box.append(err_label)
+
+        remove_btn = Gtk.Button(icon_name="user-trash-symbolic")
+        remove_btn.add_css_class("flat")
+        remove_btn.set_tooltip_text(_("Remove from queue"))
+        # Positions in the dialog's store match indexes in self._queue
+        remove_btn.connect("clicked", lambda b: (
+            self._remove_queue_item(list_item.get_position()), dialog.close()))
+        row_box.append(remove_btn)
+
+        list_item.set_child(row_box)
+
+    def _on_queue_row_bind(self, _factory, list_item):
+        item = list_item.get_item().item
+        row_box = list_item.get_child()
+
+        if item.status == QueueItem.STATUS_READY:
+            icon_name, css_classes = "mail-unread-symbolic", ["queue-ready"]
+        elif item.status == QueueItem.STATUS_SENDING:
+            icon_name, css_classes = "emblem-synchronizing-symbolic", []
+        elif item.status == QueueItem.STATUS_SENT:
+            icon_name, css_classes = "emblem-ok-symbolic", ["queue-sent"]
+        else:
+            icon_name, css_classes = "dialog-error-symbolic", ["queue-error"]
+        row_box.set_css_classes(css_classes)
 
-            if item.status == QueueItem.STATUS_ERROR:
-                err_label = Gtk.Label(label=_("Error"))
-                err_label.add_css_class("error")
-                row_box.append(err_label)
+        icon = row_box.get_first_child()
+        icon.set_from_icon_name(icon_name)
 
-            if item.status != QueueItem.STATUS_SENDING:
-                remove_btn = Gtk.Button(icon_name="user-trash-symbolic")
-                remove_btn.add_css_class("flat")
-                remove_btn.set_tooltip_text(_("Remove from queue"))
-                remove_btn.connect("clicked", lambda b, idx=i: (
-                    self._remove_queue_item(idx), dialog.close()))
-                row_box.append(remove_btn)
+        name_label = icon.get_next_sibling()
+        name_label.set_text(item.package)
+        name_label.set_tooltip_text(item.error_msg or None)
 
-            queue_list.append(row_box)
+        err_label = name_label.get_next_sibling()
+        err_label.set_visible(item.status == QueueItem.STATUS_ERROR)
+        err_label.get_next_sibling().set_visible(item.status != QueueItem.STATUS_SENDING)
 
     def _on_sort_queue_and_refresh_dialog(self, dialog):
         self._on_sort_queue()
@@ -1950,20 +2454,18 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _on_refresh_reviews(self, *_args):
         """Fetch pending reviews from DDTSS."""
-        settings = load_settings()
+        settings = self.settings
         if not settings.get("ddtss_alias"):
             self._show_login_dialog()
             return
         self.status_label.set_text(_("Fetching pending reviews…"))
-        threading.Thread(target=self._fetch_reviews_thread, daemon=True).start()
+        _EXECUTOR.submit(self._fetch_reviews_thread)
 
     def _fetch_reviews_thread(self):
         try:
-            settings = load_settings()
+            settings = self.settings
             lang = settings.get("language", "sv")
-            client = DDTSSClient(lang=lang)
-            if not client.is_logged_in():
-                client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
+            client = self._get_ddtss_client(lang, settings)
             reviews = client.get_pending_reviews()
             GLib.idle_add(self._on_reviews_loaded, reviews)
         except Exception as e:
@@ -2021,16 +2523,13 @@ class MainWindow(Adw.ApplicationWindow):
         self._review_detail_box.set_visible(True)
         self._review_orig_view.get_buffer().set_text(_("Loading…"))
         self._review_trans_view.get_buffer().set_text("")
-        threading.Thread(target=self._load_review_detail,
-                        args=(review["package"],), daemon=True).start()
+        _EXECUTOR.submit(self._load_review_detail, review["package"])
 
     def _load_review_detail(self, package):
         try:
-            settings = load_settings()
+            settings = self.settings
             lang = settings.get("language", "sv")
-            client = DDTSSClient(lang=lang)
-            if not client.is_logged_in():
-                client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
+            client = self._get_ddtss_client(lang, settings)
             data = client.get_review_page(package)
             GLib.idle_add(self._show_review_detail, data)
         except Exception as e:
@@ -2050,23 +2549,19 @@ class MainWindow(Adw.ApplicationWindow):
         if not self._current_review_pkg:
             return
         self.status_label.set_text(_("Accepting %s…") % self._current_review_pkg)
-        threading.Thread(target=self._do_review_action,
-                        args=(self._current_review_pkg, "accept"), daemon=True).start()
+        _EXECUTOR.submit(self._do_review_action, self._current_review_pkg, "accept")
 
     def _on_review_reject(self, *_args):
         if not self._current_review_pkg:
             return
         self.status_label.set_text(_("Rejecting %s…") % self._current_review_pkg)
-        threading.Thread(target=self._do_review_action,
-                        args=(self._current_review_pkg, "reject"), daemon=True).start()
+        _EXECUTOR.submit(self._do_review_action, self._current_review_pkg, "reject")
 
     def _do_review_action(self, package, action):
         try:
-            settings = load_settings()
+            settings = self.settings
             lang = settings.get("language", "sv")
-            client = DDTSSClient(lang=lang)
-            if not client.is_logged_in():
-                client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
+            client = self._get_ddtss_client(lang, settings)
             client.submit_review(package, action=action)
             self._session_reviews += 1
             GLib.idle_add(self._on_review_action_done, package, action)
@@ -2103,7 +2598,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         def on_response(dlg, response):
             if response == "accept":
-                settings = load_settings()
+                settings = self.settings
                 lang = settings.get("language", "sv")
                 self._on_accept_all_reviews(self._pending_reviews, lang, settings, None)
 
@@ -2118,32 +2613,32 @@ class MainWindow(Adw.ApplicationWindow):
         )
 
     def _on_open_review(self, *_args):
-        settings = load_settings()
+        settings = self.settings
         if not settings.get("ddtss_alias"):
             self._show_login_dialog()
             return
 
         self.status_label.set_text(_("Loading reviews…"))
+        lang = self._current_lang()
 
         def fetch():
             try:
-                lang = self._current_lang()
-                client = DDTSSClient(lang=lang)
-                if not client.is_logged_in():
-                    client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
+                client = self._get_ddtss_client(lang, settings)
                 self._ddtss_logged_in = True
                 reviews = client.get_pending_reviews()
                 GLib.idle_add(self._show_review_list, reviews, lang, settings)
             except Exception as exc:
                 GLib.idle_add(self.status_label.set_text, _("Error: {e}").format(e=str(exc)))
 
-        threading.Thread(target=fetch, daemon=True).start()
+        _EXECUTOR.submit(fetch)
 
     def _show_review_list(self, reviews, lang, settings):
         self.status_label.set_text("")
 
-        pending = [r for r in reviews if not r.get("reviewed_by_you")]
-        reviewed = [r for r in reviews if r.get("reviewed_by_you")]
+        pending = []
+        reviewed = []
+        for r in reviews:
+            (reviewed if r.get("reviewed_by_you") else pending).append(r)
 
         # Update review badge
         if pending:
@@ -2185,45 +2680,39 @@ class MainWindow(Adw.ApplicationWindow):
             dialog.present()
             return
 
+        # One section per non-empty group; the header factory labels them
+        sections = Gio.ListStore.new(Gio.ListStore)
+        for group in (pending, reviewed):
+            if group:
+                store = Gio.ListStore.new(ReviewObject)
+                store.splice(0, 0, [ReviewObject(r) for r in group])
+                sections.append(store)
+        model = Gtk.FlattenListModel.new(sections)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_review_row_setup)
+        factory.connect("bind", self._on_review_row_bind)
+        header_factory = Gtk.SignalListItemFactory()
+        header_factory.connect("setup", self._on_review_header_setup)
+        header_factory.connect("bind", self._on_review_header_bind)
+
         scroll = Gtk.ScrolledWindow(vexpand=True)
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        list_box.add_css_class("boxed-list")
-        list_box.set_margin_start(12)
-        list_box.set_margin_end(12)
-        list_box.set_margin_top(8)
-        scroll.set_child(list_box)
+        list_view = Gtk.ListView(
+            model=Gtk.NoSelection.new(model),
+            factory=factory,
+            header_factory=header_factory,
+            single_click_activate=True,
+        )
+        list_view.add_css_class("boxed-list")
+        list_view.set_margin_start(12)
+        list_view.set_margin_end(12)
+        list_view.set_margin_top(8)
+        list_view.connect("activate", lambda view, pos: (
+            dialog.close(),
+            self._open_review_detail(model.get_item(pos).review["package"], lang, settings)))
+        scroll.set_child(list_view)
         main_box.append(scroll)
 
-        if pending:
-            header_row = Gtk.Label(label=_("Pending review ({n})").format(n=len(pending)), xalign=0)
-            header_row.add_css_class("title-4")
-            header_row.set_margin_start(16)
-            header_row.set_margin_top(8)
-            list_box.append(header_row)
-
-            for r in pending:
-                row = Adw.ActionRow(title=r["package"], subtitle=_format_ddtss_note(r.get("note", "")), activatable=True)
-                row.add_suffix(Gtk.Image.new_from_icon_name("go-next-symbolic"))
-                row.connect("activated", lambda w, pkg=r["package"]: (
-                    dialog.close(), self._open_review_detail(pkg, lang, settings)))
-                list_box.append(row)
-
-        if reviewed:
-            header_row2 = Gtk.Label(label=_("Reviewed by you ({n})").format(n=len(reviewed)), xalign=0)
-            header_row2.add_css_class("title-4")
-            header_row2.set_margin_start(16)
-            header_row2.set_margin_top(12)
-            list_box.append(header_row2)
-
-            for r in reviewed:
-                row = Adw.ActionRow(title=r["package"], subtitle=_format_ddtss_note(r.get("note", "")), activatable=True)
-                row.add_prefix(Gtk.Image.new_from_icon_name("emblem-ok-symbolic"))
-                row.add_suffix(Gtk.Image.new_from_icon_name("go-next-symbolic"))
-                row.connect("activated", lambda w, pkg=r["package"]: (
-                    dialog.close(), self._open_review_detail(pkg, lang, settings)))
-                list_box.append(row)
-
         info = Gtk.Label(
             label=_("{pending} pending, {reviewed} reviewed by you").format(
                 pending=len(pending), reviewed=len(reviewed)),
@@ -2237,6 +2726,37 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_content(main_box)
         dialog.present()
 
+    def _on_review_row_setup(self, _factory, list_item):
+        row = Adw.ActionRow(activatable=False)
+        # Kept on the row so bind can show it for reviewed entries only
+        row.reviewed_icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
+        row.add_prefix(row.reviewed_icon)
+        row.add_suffix(Gtk.Image.new_from_icon_name("go-next-symbolic"))
+        list_item.set_child(row)
+
+    def _on_review_row_bind(self, _factory, list_item):
+        review = list_item.get_item().review
+        row = list_item.get_child()
+        row.set_title(review["package"])
+        row.set_subtitle(_format_ddtss_note(review.get("note", "")))
+        row.reviewed_icon.set_visible(bool(review.get("reviewed_by_you")))
+
+    def _on_review_header_setup(self, _factory, list_header):
+        label = Gtk.Label(xalign=0)
+        label.add_css_class("title-4")
+        label.set_margin_start(16)
+        list_header.set_child(label)
+
+    def _on_review_header_bind(self, _factory, list_header):
+        label = list_header.get_child()
+        n = list_header.get_n_items()
+        if list_header.get_item().review.get("reviewed_by_you"):
+            label.set_text(_("Reviewed by you ({n})").format(n=n))
+            label.set_margin_top(12)
+        else:
+            label.set_text(_("Pending review ({n})").format(n=n))
+            label.set_margin_top(8)
+
     def _on_accept_all_reviews(self, pending, lang, settings, parent_dialog):
         confirm = Adw.MessageDialog(
             transient_for=self,
@@ -2260,41 +2780,47 @@ class MainWindow(Adw.ApplicationWindow):
     def _batch_accept_reviews(self, pending, lang, settings):
         self.status_label.set_text(_("Accepting {n} reviews…").format(n=len(pending)))
 
+        def accept_one(package):
+            # The workers share one client; DDTSSClient locks its own state
+            client = self._get_ddtss_client(lang, settings)
+            data = client.get_review_page(package)
+            client.submit_review(
+                package, action="accept",
+                short=data["short_trans"], long=data["long_trans"], comment="")
+
         def do_accept():
             accepted = 0
             errors = 0
-            for r in pending:
-                try:
-                    client = DDTSSClient(lang=lang)
-                    if not client.is_logged_in():
-                        client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
-                    data = client.get_review_page(r["package"])
-                    client.submit_review(
-                        r["package"], action="accept",
-                        short=data["short_trans"], long=data["long_trans"], comment="")
-                    accepted += 1
-                except Exception:
-                    errors += 1
+            # A pool of its own: waiting on _EXECUTOR from one of its own
+            # jobs could starve it
+            with _DaemonExecutor(max_workers=BATCH_WORKERS) as pool:
+                futures = [pool.submit(accept_one, r["package"]) for r in pending]
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        future.result()
+                        accepted += 1
+                    except Exception:
+                        errors += 1
+                    progress = _("Accepting reviews… {done}/{n}").format(done=done, n=len(pending))
+                    GLib.idle_add(self.status_label.set_text, progress)
             msg = _("Accepted {accepted} reviews, {errors} errors").format(
                 accepted=accepted, errors=errors)
             GLib.idle_add(self.status_label.set_text, msg)
 
-        threading.Thread(target=do_accept, daemon=True).start()
+        _EXECUTOR.submit(do_accept)
 
     def _open_review_detail(self, package, lang, settings):
         self.status_label.set_text(_("Loading review for {pkg}…").format(pkg=package))
 
         def fetch():
             try:
-                client = DDTSSClient(lang=lang)
-                if not client.is_logged_in():
-                    client.login(settings["ddtss_alias"], settings.get("ddtss_password", ""))
+                client = self._get_ddtss_client(lang, settings)
                 data = client.get_review_page(package)
                 GLib.idle_add(self._show_review_detail, data, lang, settings)
             except Exception as exc:
                 GLib.idle_add(self.status_label.set_text, _("Error: {e}").format(e=str(exc)))
 
-        threading.Thread(target=fetch, daemon=True).start()
+        _EXECUTOR.submit(fetch)
 
     def _show_review_result(self, package, action, success, error_msg):
         if success:
@@ -2335,7 +2861,7 @@ class MainWindow(Adw.ApplicationWindow):
                 GLib.idle_add(self.status_label.set_text,
                               _("Failed to fetch statistics: {e}").format(e=str(exc)))
 
-        threading.Thread(target=do_fetch, daemon=True).start()
+        _EXECUTOR.submit(do_fetch)
 
     def _show_stats_dialog(self, stats):
         self.status_label.set_text(_("Ready"))
@@ -2350,11 +2876,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         pct = (active_trans / active_pkgs) * 100 if active_pkgs > 0 else 0
 
-        lang_name = lang
-        for code, name in DDTP_LANGUAGES:
-            if code == lang:
-                lang_name = name
-                break
+        lang_name = DDTP_LANGUAGE_NAMES.get(lang, lang)
 
         body = _(
             "Language: {lang} ({code})\n\n"
@@ -2384,10 +2906,6 @@ class MainWindow(Adw.ApplicationWindow):
     # --- Lint ---
 
     def _on_lint(self, *_args):
-        import shutil
-        import subprocess
-        import tempfile
-
         if not self.current_pkg:
             self.status_label.set_text(_("No package selected"))
             return
@@ -2398,7 +2916,7 @@ class MainWindow(Adw.ApplicationWindow):
             self.status_label.set_text(_("Translation is empty — nothing to lint"))
             return
 
-        if not shutil.which("l10n-lint"):
+        if not _find_tool("l10n-lint"):
             dialog = Adw.MessageDialog(
                 transient_for=self,
                 heading=_("l10n-lint not found"),
@@ -2422,38 +2940,30 @@ class MainWindow(Adw.ApplicationWindow):
         long_trans = lines[1].strip() if len(lines) > 1 else ""
 
         po_content = (
-            f'msgid "{self._po_escape(pkg["short"])}"\n'
-            f'msgstr "{self._po_escape(short_trans)}"\n'
+            f'msgid "{_po_escape(pkg["short"])}"\n'
+            f'msgstr "{_po_escape(short_trans)}"\n'
         )
         if pkg["long"] and long_trans:
             po_content += (
                 f'\nmsgctxt "long:{pkg["package"]}"\n'
-                f'msgid {self._po_escape_multiline(pkg["long"])}\n'
-                f'msgstr {self._po_escape_multiline(long_trans)}\n'
+                f'msgid {_po_quote(pkg["long"])}\n'
+                f'msgstr {_po_quote(long_trans)}\n'
             )
 
         self.status_label.set_text(_("Running l10n-lint…"))
 
         def do_lint():
             try:
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".po", delete=False, encoding="utf-8") as f:
-                    f.write(f'msgid ""\nmsgstr ""\n"Language: {lang}\\n"\n'
-                            f'"Content-Type: text/plain; charset=UTF-8\\n"\n\n')
-                    f.write(po_content)
-                    tmp_path = f.name
-
-                result = subprocess.run(
-                    ["l10n-lint", "--format", "text", tmp_path],
-                    capture_output=True, text=True, timeout=30,
-                )
-                os.unlink(tmp_path)
+                header = (f'msgid ""\nmsgstr ""\n"Language: {lang}\\n"\n'
+                          f'"Content-Type: text/plain; charset=UTF-8\\n"\n\n')
+                result = _run_l10n_lint(header + po_content, timeout=30)
                 output = (result.stdout + result.stderr).strip()
                 GLib.idle_add(self._show_lint_result, output, result.returncode)
             except Exception as exc:
                 GLib.idle_add(self.status_label.set_text,
                               _("Lint error: {e}").format(e=str(exc)))
 
-        threading.Thread(target=do_lint, daemon=True).start()
+        _EXECUTOR.submit(do_lint)
 
     def _show_lint_result(self, output, returncode):
         self.status_label.set_text(_("Ready"))
@@ -2485,7 +2995,7 @@ class MainWindow(Adw.ApplicationWindow):
         if not ready:
             return
 
-        settings = load_settings()
+        settings = self.settings
         if not settings.get("ddtss_alias"):
             self._show_login_dialog()
             return
@@ -2570,7 +3080,8 @@ class MainWindow(Adw.ApplicationWindow):
         self._batch_dialog.set_content(dialog_box)
         self._batch_dialog.present()
 
-        threading.Thread(target=self._batch_send_worker, daemon=True).start()
+        threading.Thread(target=self._batch_send_worker, args=(self._current_lang(),),
+                         daemon=True).start()
 
     def _batch_log(self, text):
         def do_log():
@@ -2583,9 +3094,8 @@ class MainWindow(Adw.ApplicationWindow):
         self._batch_cancel_btn.set_sensitive(False)
         self._batch_log(_("⏸ Cancelling…"))
 
-    def _batch_send_worker(self):
-        settings = load_settings()
-        lang = self._current_lang()
+    def _batch_send_worker(self, lang):
+        settings = self.settings
 
         ready = [q for q in self._queue if q.status == QueueItem.STATUS_READY]
         total = len(ready)
@@ -2598,7 +3108,7 @@ class MainWindow(Adw.ApplicationWindow):
                     sent=sent, total=total))
                 break
 
-            item.status = QueueItem.STATUS_SENDING
+            self._set_queue_status(item, QueueItem.STATUS_SENDING)
             GLib.idle_add(self._update_queue_badge)
             GLib.idle_add(self._batch_current.set_text,
                           _("Sending: {pkg} ({i}/{total})").format(pkg=item.package, i=i + 1, total=total))
@@ -2606,30 +3116,26 @@ class MainWindow(Adw.ApplicationWindow):
             GLib.idle_add(self._batch_progress.set_text, f"{i + 1}/{total}")
 
             try:
-                client = DDTSSClient(lang=lang)
-                if not client.is_logged_in():
-                    client.login(settings.get("ddtss_alias", ""), settings.get("ddtss_password", ""))
+                client = self._get_ddtss_client(lang, settings)
                 client.submit_translation(item.package, item.short, item.long_text)
                 self._ddtss_logged_in = True
-                item.status = QueueItem.STATUS_SENT
+                self._set_queue_status(item, QueueItem.STATUS_SENT)
                 sent += 1
-                self._submitted_packages.add(item.package)
-                self._modified_packages.discard(item.package)
-                self._error_packages.discard(item.package)
+                self._pkg_flags[item.package] = PKG_SUBMITTED
                 self._batch_log(f"✅ {item.package}")
             except Exception as exc:
-                item.status = QueueItem.STATUS_ERROR
+                self._set_queue_status(item, QueueItem.STATUS_ERROR)
                 item.error_msg = str(exc)
                 errors += 1
-                self._error_packages.add(item.package)
+                self._set_pkg_flag(item.package, PKG_ERROR)
                 self._batch_log(f"❌ {item.package}: {exc}")
 
-            _save_queue(self._queue)
+            GLib.idle_add(self._schedule_queue_save)
             _log_event(f"Batch: {item.package} -> {item.status}")
             GLib.idle_add(self._update_queue_badge)
             GLib.idle_add(self._batch_progress.set_fraction, (i + 1) / total)
 
-        _save_queue(self._queue)
+        GLib.idle_add(self._schedule_queue_save)
 
         self._batch_running = False
         summary = _("Done! {sent} sent, {errors} errors out of {total}").format(
@@ -2654,8 +3160,9 @@ class MainWindow(Adw.ApplicationWindow):
     # --- Close confirmation ---
 
     def _on_close_request(self, *_args):
-        ready_count = sum(1 for q in self._queue if q.status == QueueItem.STATUS_READY)
-        modified_count = len(self._modified_packages)
+        self._flush_queue_save()
+        ready_count = self._queue_counts[QueueItem.STATUS_READY]
+        modified_count = sum(1 for f in self._pkg_flags.values() if f & PKG_MODIFIED)
 
         warnings = []
         if ready_count > 0:
@@ -2812,54 +3319,32 @@ class MainWindow(Adw.ApplicationWindow):
         path = gfile.get_path()
         lang = self._current_lang()
         export_pkgs = getattr(self, '_export_pkgs_pending', self.packages)
-        lines = [
-            '# DDTP translations export',
-            f'# Language: {lang}',
-            f'# Packages: {len(export_pkgs)}',
-            '#',
-            'msgid ""', 'msgstr ""',
-            f'"Language: {lang}\\n"',
-            '"Content-Type: text/plain; charset=UTF-8\\n"',
-            '"Content-Transfer-Encoding: 8bit\\n"',
-            '',
-        ]
+        buf = io.StringIO()
+        buf.write(
+            '# DDTP translations export\n'
+            f'# Language: {lang}\n'
+            f'# Packages: {len(export_pkgs)}\n'
+            '#\n'
+            'msgid ""\nmsgstr ""\n'
+            f'"Language: {lang}\\n"\n'
+            '"Content-Type: text/plain; charset=UTF-8\\n"\n'
+            '"Content-Transfer-Encoding: 8bit\\n"\n\n'
+        )
 
         for pkg in export_pkgs:
-            lines.append(f'#. Package: {pkg["package"]}')
-            lines.append(f'#. MD5: {pkg["md5"]}')
-            lines.append(f'msgid "{self._po_escape(pkg["short"])}"')
-            lines.append('msgstr ""')
-            lines.append('')
+            _write_po_entry(buf, pkg["short"], comments=(
+                f'Package: {pkg["package"]}', f'MD5: {pkg["md5"]}'))
             if pkg["long"]:
-                lines.append(f'#. Long description for {pkg["package"]}')
-                lines.append(f'msgctxt "long:{pkg["package"]}"')
-                escaped = self._po_escape_multiline(pkg["long"])
-                lines.append(f'msgid {escaped}')
-                lines.append('msgstr ""')
-                lines.append('')
+                _write_po_entry(
+                    buf, pkg["long"], msgctxt=f'long:{pkg["package"]}',
+                    comments=(f'Long description for {pkg["package"]}',))
 
         with open(path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines) + '\n')
+            f.write(buf.getvalue())
 
         self.status_label.set_text(
             _("Exported {n} packages to {path}").format(n=len(export_pkgs), path=os.path.basename(path)))
 
-    def _po_escape(self, s):
-        return s.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
-
-    def _po_escape_multiline(self, s):
-        lines = s.split('\n')
-        if len(lines) == 1:
-            return f'"{self._po_escape(s)}"'
-        parts = ['""']
-        for i, line in enumerate(lines):
-            escaped = self._po_escape(line)
-            if i < len(lines) - 1:
-                parts.append(f'"{escaped}\\n"')
-            else:
-                parts.append(f'"{escaped}"')
-        return '\n'.join(parts)
-
     # --- PO Import with Review Window ---
 
     def _on_import_po(self, *_args):
@@ -2889,8 +3374,6 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _show_import_review(self, translations):
         """Show import review window with lint results."""
-        import shutil
-
         review_win = Adw.Window(
             transient_for=self,
             title=_("Import Review — {n} translations").format(n=len(translations)),
@@ -2938,7 +3421,7 @@ class MainWindow(Adw.ApplicationWindow):
         content_paned.set_end_child(detail_box)
         main_box.append(content_paned)
 
-        has_lint = shutil.which("l10n-lint") is not None
+        has_lint = _find_tool("l10n-lint") is not None
 
         for i, (pkg, md5, short, long_text) in enumerate(translations):
             row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -2978,32 +3461,24 @@ class MainWindow(Adw.ApplicationWindow):
         list_box.connect("row-selected", on_row_selected)
 
         if has_lint:
+            lang = self._current_lang()
+
             def run_lint_all():
-                import subprocess
-                import tempfile
-                lang = self._current_lang()
                 for i, (pkg, md5, short, long_text) in enumerate(translations):
                     try:
                         po_content = (
                             f'msgid ""\nmsgstr ""\n"Language: {lang}\\n"\n'
                             f'"Content-Type: text/plain; charset=UTF-8\\n"\n\n'
-                            f'msgid "{self._po_escape(short)}"\n'
-                            f'msgstr "{self._po_escape(short)}"\n'
-                        )
-                        with tempfile.NamedTemporaryFile(mode="w", suffix=".po", delete=False, encoding="utf-8") as f:
-                            f.write(po_content)
-                            tmp_path = f.name
-                        result = subprocess.run(
-                            ["l10n-lint", "--format", "text", tmp_path],
-                            capture_output=True, text=True, timeout=10,
+                            f'msgid "{_po_escape(short)}"\n'
+                            f'msgstr "{_po_escape(short)}"\n'
                         )
-                        os.unlink(tmp_path)
+                        result = _run_l10n_lint(po_content, timeout=10)
                         lint_ok = result.returncode == 0
                         GLib.idle_add(self._update_import_lint_icon, list_box, i, lint_ok)
                     except Exception:
                         GLib.idle_add(self._update_import_lint_icon, list_box, i, True)
 
-            threading.Thread(target=run_lint_all, daemon=True).start()
+            _EXECUTOR.submit(run_lint_all)
         else:
             info_label = Gtk.Label(
                 label=_("l10n-lint not installed — skipping lint checks"),
@@ -3080,13 +3555,13 @@ class MainWindow(Adw.ApplicationWindow):
                 if existing:
                     existing.short = short
                     existing.long_text = long_text
-                    existing.status = QueueItem.STATUS_READY
+                    self._set_queue_status(existing, QueueItem.STATUS_READY)
                     existing.error_msg = ""
                     updated += 1
                 else:
-                    self._queue.append(QueueItem(pkg, md5, short, long_text))
+                    self._queue_append(QueueItem(pkg, md5, short, long_text))
                     added += 1
-        _save_queue(self._queue)
+        self._schedule_queue_save()
         self._update_queue_badge()
         self._update_status_bar()
         self.status_label.set_text(
@@ -3105,14 +3580,14 @@ class MainWindow(Adw.ApplicationWindow):
             if existing:
                 existing.short = short
                 existing.long_text = long_text
-                existing.status = QueueItem.STATUS_READY
+                self._set_queue_status(existing, QueueItem.STATUS_READY)
                 existing.error_msg = ""
                 updated += 1
             else:
-                self._queue.append(QueueItem(pkg, md5, short, long_text))
+                self._queue_append(QueueItem(pkg, md5, short, long_text))
                 added += 1
 
-        _save_queue(self._queue)
+        self._schedule_queue_save()
         self._update_queue_badge()
         self._update_status_bar()
         self.status_label.set_text(
@@ -3228,8 +3703,7 @@ class DDTPTranslateApp(Adw.Application):
         win = self.props.active_window
         if not win:
             win = MainWindow(self)
-            settings = load_settings()
-            if not settings.get("welcome_shown"):
+            if not win.settings.get("welcome_shown"):
                 GLib.idle_add(self._show_welcome, win)
         win.present()
 
@@ -3261,9 +3735,8 @@ class DDTPTranslateApp(Adw.Application):
 
         def on_response(d, response):
             d.close()
-            settings = load_settings()
-            settings["welcome_shown"] = True
-            save_settings(settings)
+            win.settings["welcome_shown"] = True
+            save_settings(win.settings)
             if response == "register":
                 Gtk.show_uri(win, "https://ddtp.debian.org/ddtss/index.cgi/createlogin", Gdk.CURRENT_TIME)
 
@@ -3331,6 +3804,9 @@ class DDTPTranslateApp(Adw.Application):
             settings["ddtss_alias"] = alias
             settings["ddtss_password"] = password
             save_settings(settings)
+            for win in self.get_windows():
+                if isinstance(win, MainWindow):
+                    win._reload_settings()
             dialog.close()
             self.status_label.set_text(_("Credentials saved"))
             # Retry submit
@@ -3410,6 +3886,9 @@ class DDTPTranslateApp(Adw.Application):
             win._on_refresh()
 
     def _on_quit_action(self, *_args):
+        for win in self.get_windows():
+            if isinstance(win, MainWindow):
+                win._flush_queue_save()
         self.quit()
 
     def _on_preferences(self, *_args):
@@ -3486,6 +3965,11 @@ class DDTPTranslateApp(Adw.Application):
 def main():
     app = DDTPTranslateApp()
     app.run(sys.argv)
+    # Drop background jobs that have not started yet; running ones are
+    # on daemon threads and do not hold up the exit
+    _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    # The log writer is a daemon thread; let it finish the last events
+    _flush_log()
 
 if __name__ == "__main__":
     main()